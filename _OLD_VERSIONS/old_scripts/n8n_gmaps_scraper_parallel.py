@@ -14,79 +14,85 @@ Usage:
 
 import os
 import sys
-import json
-import time
 import argparse
+import asyncio
 import hashlib
 import re
 from datetime import datetime
-from typing import Optional, Dict, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import requests
+from typing import Optional, Dict, List, Sequence
+import httpx
+import orjson
 from dotenv import load_dotenv
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 # Load environment variables
 load_dotenv()
 
 # N8N Webhook URL
 WEBHOOK_URL = "https://n8n.srv1080136.hstgr.cloud/webhook/c66d6d2a-f22d-4fb6-b874-18ae5915347b"
 
+# Queries are posted as UTF-8 encoded bytes, so the charset is declared
+WEBHOOK_HEADERS = {"Content-Type": "text/plain; charset=utf-8"}
+
 # Regional city mappings
+_NORTH_NJ = ("Newark", "Jersey City", "Paterson", "Elizabeth", "Clifton", "Passaic", "Union City", "Bayonne", "East Orange", "Hackensack")
+_CENTRAL_NJ = ("Edison", "Woodbridge", "New Brunswick", "Perth Amboy", "Sayreville", "East Brunswick", "Old Bridge", "Piscataway")
+_SOUTH_NJ = ("Camden", "Cherry Hill", "Trenton", "Atlantic City", "Vineland", "Gloucester", "Pennsauken")
+_NYC = ("Manhattan", "Brooklyn", "Queens", "Bronx", "Staten Island")
+_NJ = ("Newark", "Jersey City", "Paterson", "Elizabeth", "Edison", "Woodbridge", "Lakewood", "Trenton", "Camden", "Clifton")
+
+# Normalized region -> (cities, state code)
 REGION_CITIES = {
     # New Jersey regions
-    "north new jersey": ["Newark", "Jersey City", "Paterson", "Elizabeth", "Clifton", "Passaic", "Union City", "Bayonne", "East Orange", "Hackensack"],
-    "north nj": ["Newark", "Jersey City", "Paterson", "Elizabeth", "Clifton", "Passaic", "Union City", "Bayonne", "East Orange", "Hackensack"],
-    "northern nj": ["Newark", "Jersey City", "Paterson", "Elizabeth", "Clifton", "Passaic", "Union City", "Bayonne", "East Orange", "Hackensack"],
+    "north new jersey": (_NORTH_NJ, "NJ"),
+    "north nj": (_NORTH_NJ, "NJ"),
+    "northern nj": (_NORTH_NJ, "NJ"),
 
-    "central new jersey": ["Edison", "Woodbridge", "New Brunswick", "Perth Amboy", "Sayreville", "East Brunswick", "Old Bridge", "Piscataway"],
-    "central nj": ["Edison", "Woodbridge", "New Brunswick", "Perth Amboy", "Sayreville", "East Brunswick", "Old Bridge", "Piscataway"],
+    "central new jersey": (_CENTRAL_NJ, "NJ"),
+    "central nj": (_CENTRAL_NJ, "NJ"),
 
-    "south new jersey": ["Camden", "Cherry Hill", "Trenton", "Atlantic City", "Vineland", "Gloucester", "Pennsauken"],
-    "south nj": ["Camden", "Cherry Hill", "Trenton", "Atlantic City", "Vineland", "Gloucester", "Pennsauken"],
-    "southern nj": ["Camden", "Cherry Hill", "Trenton", "Atlantic City", "Vineland", "Gloucester", "Pennsauken"],
+    "south new jersey": (_SOUTH_NJ, "NJ"),
+    "south nj": (_SOUTH_NJ, "NJ"),
+    "southern nj": (_SOUTH_NJ, "NJ"),
 
-    "essex county nj": ["Newark", "East Orange", "Irvington", "Orange", "Bloomfield", "Montclair", "Belleville", "Nutley", "Livingston"],
-    "union county nj": ["Elizabeth", "Union", "Plainfield", "Linden", "Rahway", "Westfield", "Summit", "Cranford", "Roselle"],
-    "hudson county nj": ["Jersey City", "Hoboken", "Union City", "West New York", "Bayonne", "North Bergen", "Secaucus"],
-    "bergen county nj": ["Hackensack", "Paramus", "Fort Lee", "Fair Lawn", "Garfield", "Lodi", "Englewood", "Teaneck"],
+    "essex county nj": (("Newark", "East Orange", "Irvington", "Orange", "Bloomfield", "Montclair", "Belleville", "Nutley", "Livingston"), "NJ"),
+    "union county nj": (("Elizabeth", "Union", "Plainfield", "Linden", "Rahway", "Westfield", "Summit", "Cranford", "Roselle"), "NJ"),
+    "hudson county nj": (("Jersey City", "Hoboken", "Union City", "West New York", "Bayonne", "North Bergen", "Secaucus"), "NJ"),
+    "bergen county nj": (("Hackensack", "Paramus", "Fort Lee", "Fair Lawn", "Garfield", "Lodi", "Englewood", "Teaneck"), "NJ"),
 
     # New York regions
-    "new york city": ["Manhattan", "Brooklyn", "Queens", "Bronx", "Staten Island"],
-    "nyc": ["Manhattan", "Brooklyn", "Queens", "Bronx", "Staten Island"],
-    "manhattan": ["Manhattan"],
-    "brooklyn": ["Brooklyn"],
+    "new york city": (_NYC, "NY"),
+    "nyc": (_NYC, "NY"),
+    "manhattan": (("Manhattan",), "NY"),
+    "brooklyn": (("Brooklyn",), "NY"),
 
     # Default fallback for state-wide
-    "new jersey": ["Newark", "Jersey City", "Paterson", "Elizabeth", "Edison", "Woodbridge", "Lakewood", "Trenton", "Camden", "Clifton"],
-    "nj": ["Newark", "Jersey City", "Paterson", "Elizabeth", "Edison", "Woodbridge", "Lakewood", "Trenton", "Camden", "Clifton"],
+    "new jersey": (_NJ, "NJ"),
+    "nj": (_NJ, "NJ"),
 }
 
 
-def expand_location(location: str) -> tuple[List[str], str]:
+def expand_location(location: str) -> tuple[Sequence[str], str]:
     """
     Expand a location string into a list of cities.
 
     Examples:
-        "North New Jersey" → (["Newark", "Elizabeth", ...], "NJ")
+        "North New Jersey" → (("Newark", "Elizabeth", ...), "NJ")
         "Newark, NJ" → (["Newark"], "NJ")
-        "Essex County NJ" → (["Newark", "East Orange", ...], "NJ")
+        "Essex County NJ" → (("Newark", "East Orange", ...), "NJ")
 
     Returns:
-        (cities_list, state_code)
+        (cities, state_code)
     """
-    location_lower = location.lower().strip()
-
     # Check if it's a regional query
-    if location_lower in REGION_CITIES:
-        cities = REGION_CITIES[location_lower]
-        # Extract state from first match
-        if "nj" in location_lower or "jersey" in location_lower:
-            state = "NJ"
-        elif "ny" in location_lower or "york" in location_lower:
-            state = "NY"
-        else:
-            state = "NJ"  # Default
-        return cities, state
+    region = REGION_CITIES.get(location.lower().strip())
+    if region:
+        return region
 
     # Check if it's "City, State" format
     if "," in location:
@@ -110,32 +116,99 @@ def calculate_cities_needed(target_leads: int, avg_leads_per_city: int = 15) ->
     return min(cities_needed, 20)  # Cap at 20 cities max
 
 
-def call_webhook_single(query: str, timeout: int = 60) -> List[dict]:
-    """Call N8N webhook for a single query."""
+async def _fetch(
+    client: httpx.AsyncClient,
+    query: str,
+    body: bytes,
+    timeout: int = 60
+) -> tuple[str, List[dict]]:
+    """POST one query to the N8N webhook on a shared client; returns (query, leads)."""
     try:
-        response = requests.post(
+        response = await client.post(
             WEBHOOK_URL,
-            data=query,
-            headers={"Content-Type": "text/plain"},
+            content=body,
+            headers=WEBHOOK_HEADERS,
             timeout=timeout
         )
 
         if response.status_code == 200:
             data = response.json()
             if isinstance(data, list):
-                return data
+                return query, data
             elif isinstance(data, dict) and 'results' in data:
-                return data['results']
-        return []
+                return query, data['results']
+        return query, []
     except Exception as e:
         print(f"   ❌ Error querying '{query}': {e}")
-        return []
+        return query, []
+
+
+async def _fanout(queries: List[str], max_workers: int, batch_delay: float) -> List[dict]:
+    """Run the webhook batches concurrently over one pooled async client."""
+    all_results = []
+    seen_ids = set()
+
+    # Connections (and their TLS sessions) are capped at max_workers and
+    # reused across every batch
+    transport = httpx.AsyncHTTPTransport(
+        retries=2,
+        limits=httpx.Limits(
+            max_connections=max_workers,
+            max_keepalive_connections=max_workers
+        )
+    )
+
+    # Encode every request body up front
+    payloads = [(query, query.encode('utf-8')) for query in queries]
+
+    # Process queries in batches to avoid overwhelming N8N
+    batch_size = max_workers
+    async with httpx.AsyncClient(transport=transport) as client:
+        for batch_num, i in enumerate(range(0, len(queries), batch_size), 1):
+            batch = payloads[i:i+batch_size]
+
+            print(f"\n📦 Batch {batch_num}/{(len(queries)-1)//batch_size + 1} ({len(batch)} queries)")
+
+            # Process results as they complete; leads from one batch share
+            # a timestamp
+            tasks = [_fetch(client, query, body) for query, body in batch]
+            scraped_at = None
+            for j, task in enumerate(asyncio.as_completed(tasks), 1):
+                query, results = await task
+                if scraped_at is None:
+                    scraped_at = datetime.now().isoformat()
+
+                # Deduplicate
+                new_leads = 0
+                for lead in results:
+                    lead_id = generate_lead_id(lead)
+                    if lead_id not in seen_ids:
+                        seen_ids.add(lead_id)
+                        lead['search_query'] = query
+                        lead['scraped_at'] = scraped_at
+                        all_results.append(lead)
+                        new_leads += 1
+
+                # One write per response keeps progress output off the hot path
+                print(
+                    f"   [{j}/{len(batch)}] {query}\n"
+                    f"      → {len(results)} results, {new_leads} new (Total: {len(all_results)})"
+                )
+
+            # Delay between batches (except last batch)
+            if i + batch_size < len(queries):
+                await asyncio.sleep(batch_delay)
+
+    return all_results
 
 
 def call_webhook_parallel(queries: List[str], max_workers: int = 3, batch_delay: float = 1.0) -> List[dict]:
     """
     Send multiple queries to N8N in parallel with batching to avoid overwhelming server.
 
+    Queries within a batch run concurrently on the event loop rather than
+    one thread per in-flight request.
+
     Args:
         queries: List of search queries
         max_workers: Number of parallel requests per batch (default 3)
@@ -148,59 +221,31 @@ def call_webhook_parallel(queries: List[str], max_workers: int = 3, batch_delay:
     print(f"   Batch size: {max_workers} workers")
     print(f"   Batch delay: {batch_delay}s")
 
-    all_results = []
-    seen_ids = set()
+    return asyncio.run(_fanout(queries, max_workers, batch_delay))
 
-    # Process queries in batches to avoid overwhelming N8N
-    batch_size = max_workers
-    for batch_num, i in enumerate(range(0, len(queries), batch_size), 1):
-        batch = queries[i:i+batch_size]
-
-        print(f"\n📦 Batch {batch_num}/{(len(queries)-1)//batch_size + 1} ({len(batch)} queries)")
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit batch
-            future_to_query = {
-                executor.submit(call_webhook_single, query): query
-                for query in batch
-            }
-
-            # Process results as they complete
-            for j, future in enumerate(as_completed(future_to_query), 1):
-                query = future_to_query[future]
-                try:
-                    results = future.result()
-
-                    # Deduplicate
-                    new_leads = 0
-                    for lead in results:
-                        lead_id = generate_lead_id(lead)
-                        if lead_id not in seen_ids:
-                            seen_ids.add(lead_id)
-                            lead['search_query'] = query
-                            lead['scraped_at'] = datetime.now().isoformat()
-                            all_results.append(lead)
-                            new_leads += 1
-
-                    print(f"   [{j}/{len(batch)}] {query}")
-                    print(f"      → {len(results)} results, {new_leads} new (Total: {len(all_results)})")
-
-                except Exception as e:
-                    print(f"   ❌ Failed: {query} - {e}")
-
-        # Delay between batches (except last batch)
-        if i + batch_size < len(queries):
-            time.sleep(batch_delay)
 
-    return all_results
+def generate_lead_id(lead: dict) -> str:
+    """
+    Generate unique ID for deduplication.
+
+    Uses place_id when present; otherwise hashes name|address, lowercased and
+    stripped so case/whitespace variants of the same business collide.
+    """
+    place_id = lead.get('place_id')
+    if place_id:
+        return place_id
+    name = (lead.get('name') or '').strip().lower()
+    address = (lead.get('address') or '').strip().lower()
+    unique_str = f"{name}|{address}"
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(unique_str)
+    # 64-bit digest is ample for dedup within a scrape
+    return hashlib.blake2b(unique_str.encode(), digest_size=8).hexdigest()
 
 
-def generate_lead_id(lead: dict) -> str:
-    """Generate unique ID for deduplication."""
-    if lead.get('place_id'):
-        return lead['place_id']
-    unique_str = f"{lead.get('name', '')}|{lead.get('address', '')}"
-    return hashlib.md5(unique_str.encode()).hexdigest()
+# Image filenames that scrapers often pick up as emails (e.g. "logo@2x.png")
+_IMG_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 def is_valid_email(email: str) -> bool:
@@ -211,26 +256,20 @@ def is_valid_email(email: str) -> bool:
     email = email.strip().lower()
 
     # Filter out image files
-    if any(email.endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']):
+    if email.endswith(_IMG_EXTS):
         return False
 
     # Basic email format check
-    if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-        return False
-
-    return True
+    return _EMAIL_RE.match(email) is not None
 
 
 def clean_lead(lead: dict) -> dict:
-    """Clean and normalize a lead."""
-    cleaned = lead.copy()
-
+    """Clean and normalize a lead in place (leads are freshly decoded, never shared)."""
     # Clean email
-    if 'email' in cleaned:
-        if not is_valid_email(cleaned['email']):
-            cleaned['email'] = None
+    if 'email' in lead and not is_valid_email(lead['email']):
+        lead['email'] = None
 
-    return cleaned
+    return lead
 
 
 def scrape_leads_parallel(
@@ -275,14 +314,18 @@ def scrape_leads_parallel(
     print(f"   Cities selected: {len(cities_to_query)}")
     print()
 
-    # Step 3: Build query list
-    queries = [f"{industry} in {city}, {state}" for city in cities_to_query]
+    # Step 3: Build query list (industry and state are fixed per scrape)
+    prefix = f"{industry} in "
+    suffix = f", {state}"
+    queries = [f"{prefix}{city}{suffix}" for city in cities_to_query]
 
     # Step 4: Send parallel queries
     all_leads = call_webhook_parallel(queries, max_workers=max_workers)
 
     # Step 5: Clean leads
-    cleaned_leads = [clean_lead(lead) for lead in all_leads]
+    for lead in all_leads:
+        clean_lead(lead)
+    cleaned_leads = all_leads
 
     # Step 6: Trim to target if we got too many
     if len(cleaned_leads) > target_leads:
@@ -314,8 +357,10 @@ def save_results(leads: list, output_path: Optional[str] = None) -> str:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = f".tmp/n8n_leads_{timestamp}.json"
 
-    with open(output_path, 'w') as f:
-        json.dump(leads, f, indent=2)
+    # orjson serializes list-of-dict payloads in C; indentation kept so the
+    # files stay readable
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(leads, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
     print(f"💾 Saved {len(leads)} leads to: {output_path}")
     return output_path
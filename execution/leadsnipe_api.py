@@ -23,7 +23,8 @@ import threading
 import sqlite3
 import asyncio
 import time
-from collections import deque
+import hashlib
+from collections import OrderedDict, deque
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
@@ -31,8 +32,9 @@ from contextlib import contextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, RedirectResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse, RedirectResponse, ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
+import orjson
 
 # Engine Zero import
 from engine_zero import EngineZero, EngineConfig
@@ -134,6 +136,9 @@ def init_database():
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
 
+    # WAL lets API reads run alongside pipeline writes (persists in the db file)
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     # Hunts table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS hunts (
@@ -163,6 +168,12 @@ def init_database():
     except sqlite3.OperationalError:
         pass # Already exists
 
+    # /api/hunts filters by user and sorts newest first
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_hunts_user_started
+        ON hunts(user_id, started_at DESC)
+    ''')
+
     # Logs table for streaming
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS hunt_logs (
@@ -180,15 +191,40 @@ def init_database():
     print("[DB] Database initialized")
 
 
-@contextmanager
-def get_db():
-    """Context manager for database connections."""
+_db_local = threading.local()
+
+
+def _connect_db() -> sqlite3.Connection:
+    """Open a connection tuned for the WAL-mode database."""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-64000")  # 64MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+@contextmanager
+def get_db():
+    """
+    Context manager for database connections.
+    Each thread keeps one open connection and reuses it across calls.
+    """
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        conn = _db_local.conn = _connect_db()
     try:
         yield conn
-    finally:
-        conn.close()
+    except Exception:
+        # Don't leave a half-finished write holding the lock on a reused connection
+        conn.rollback()
+        raise
+
+
+def rows_as_dicts(cursor: sqlite3.Cursor) -> List[dict]:
+    """Fetch all rows as dicts, reading the column names once per query."""
+    keys = [col[0] for col in cursor.description]
+    return [dict(zip(keys, row)) for row in cursor.fetchall()]
 
 
 def db_save_hunt(hunt_data: dict):
@@ -222,6 +258,9 @@ def db_save_hunt(hunt_data: dict):
         ))
         conn.commit()
 
+    # Only after the commit: /api/hunts must see the change on the next poll
+    invalidate_hunts_cache()
+
 
 def db_get_hunt(hunt_id: str) -> Optional[dict]:
     """Get hunt from database."""
@@ -239,7 +278,18 @@ def db_get_all_hunts() -> List[dict]:
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM hunts ORDER BY started_at DESC')
-        return [dict(row) for row in cursor.fetchall()]
+        return rows_as_dicts(cursor)
+
+
+def db_list_hunts(user_id: Optional[str] = None) -> List[dict]:
+    """Get all hunts (optionally for one user), newest first."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        if user_id:
+            cursor.execute('SELECT * FROM hunts WHERE user_id = ? ORDER BY started_at DESC', (user_id,))
+        else:
+            cursor.execute('SELECT * FROM hunts ORDER BY started_at DESC')
+        return rows_as_dicts(cursor)
 
 
 def db_add_log(hunt_id: str, message: str, level: str = "INFO"):
@@ -274,6 +324,65 @@ hunts: Dict[str, dict] = {}
 leads_store: Dict[str, list] = {}
 log_queues: Dict[str, deque] = {}  # hunt_id -> deque of log messages
 
+# Background bulk sends: job_id -> status/results, oldest first. Finished jobs
+# beyond BULK_JOBS_SIZE are evicted so per-recipient results don't pile up.
+BULK_JOBS_SIZE = 200
+bulk_jobs: "OrderedDict[str, dict]" = OrderedDict()
+bulk_jobs_lock = threading.Lock()
+
+# /api/hunts response cache: user_id -> (expires_at, body bytes, etag), LRU-bounded
+HUNTS_CACHE_TTL = 2.0
+HUNTS_CACHE_SIZE = 256
+hunts_list_cache: "OrderedDict[Optional[str], tuple]" = OrderedDict()
+hunts_cache_lock = threading.Lock()
+hunts_cache_generation = 0  # Bumped on every hunt write; stale reads are not stored
+
+
+def hunts_cache_get(user_id: Optional[str]) -> Optional[tuple]:
+    """Return (body, etag) for a fresh cached /api/hunts response, else None."""
+    with hunts_cache_lock:
+        entry = hunts_list_cache.get(user_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del hunts_list_cache[user_id]
+            return None
+        hunts_list_cache.move_to_end(user_id)
+        return entry[1], entry[2]
+
+
+def hunts_cache_put(user_id: Optional[str], body: bytes, etag: str, generation: int):
+    """Cache a response unless a hunt was written since its rows were read."""
+    with hunts_cache_lock:
+        if generation != hunts_cache_generation:
+            return
+        hunts_list_cache[user_id] = (time.monotonic() + HUNTS_CACHE_TTL, body, etag)
+        hunts_list_cache.move_to_end(user_id)
+        if len(hunts_list_cache) > HUNTS_CACHE_SIZE:
+            hunts_list_cache.popitem(last=False)
+
+
+def invalidate_hunts_cache():
+    """Drop cached /api/hunts responses after a hunt write has committed."""
+    global hunts_cache_generation
+    with hunts_cache_lock:
+        hunts_cache_generation += 1
+        hunts_list_cache.clear()
+
+
+def store_bulk_job(job: dict):
+    """Register a bulk send job, evicting the oldest finished jobs over BULK_JOBS_SIZE."""
+    with bulk_jobs_lock:
+        bulk_jobs[job["job_id"]] = job
+        excess = len(bulk_jobs) - BULK_JOBS_SIZE
+        if excess > 0:
+            finished = [
+                job_id for job_id, entry in bulk_jobs.items()
+                if entry["completed_at"] is not None
+            ]
+            for job_id in finished[:excess]:
+                del bulk_jobs[job_id]
+
 # ============================================================================
 # Location Parser
 # ============================================================================
@@ -1166,9 +1275,20 @@ def enrich_leads_with_insights(leads: List[Dict], hunt_id: str = None, max_worke
 # Gmail Send Functions
 # ============================================================================
 
-def send_gmail_email(to_email: str, subject: str, body: str, from_name: str = "LeadSnipe") -> Dict:
+def build_gmail_service():
+    """Build an authenticated Gmail API client from token.json."""
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build
+
+    creds = Credentials.from_authorized_user_file("token.json")
+    return build("gmail", "v1", credentials=creds)
+
+
+def send_gmail_email(to_email: str, subject: str, body: str, from_name: str = "LeadSnipe",
+                     service=None) -> Dict:
     """
     Send an email via Gmail API (not just draft).
+    Pass an existing `service` to reuse an authenticated client.
     Returns: {success, message_id, error}
     """
     import base64
@@ -1183,11 +1303,8 @@ def send_gmail_email(to_email: str, subject: str, body: str, from_name: str = "L
             result["error"] = "Gmail not connected. Please connect Gmail first."
             return result
 
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
-
-        creds = Credentials.from_authorized_user_file("token.json")
-        service = build("gmail", "v1", credentials=creds)
+        if service is None:
+            service = build_gmail_service()
 
         # Create message
         message = MIMEMultipart()
@@ -1216,29 +1333,59 @@ def send_gmail_email(to_email: str, subject: str, body: str, from_name: str = "L
     return result
 
 
-def send_bulk_emails(emails: List[Dict], delay_seconds: int = 3) -> List[Dict]:
+def send_bulk_emails(emails: List[Dict], delay_seconds: int = 3, max_workers: int = 5) -> List[Dict]:
     """
-    Send multiple emails with rate limiting.
+    Send multiple emails in parallel with per-worker rate limiting.
+    Each worker builds one Gmail client and reuses it for all of its sends.
     emails: [{to, subject, body}, ...]
-    Returns: [{to, success, message_id, error}, ...]
+    Returns: [{to, success, message_id, error}, ...] (same order as emails)
     """
-    results = []
+    worker_state = threading.local()
+
+    def send_one(email: Dict) -> Dict:
+        if not hasattr(worker_state, "service"):
+            worker_state.sent_any = False
+            try:
+                worker_state.service = build_gmail_service() if os.path.exists("token.json") else None
+            except Exception:
+                worker_state.service = None  # send_gmail_email reports the error
+
+        # Rate limiting delay between this worker's sends
+        if worker_state.sent_any:
+            time.sleep(delay_seconds)
+        worker_state.sent_any = True
 
-    for i, email in enumerate(emails):
-        # Send email
         result = send_gmail_email(
             to_email=email.get("to"),
             subject=email.get("subject"),
-            body=email.get("body")
+            body=email.get("body"),
+            service=worker_state.service
         )
         result["to"] = email.get("to")
-        results.append(result)
+        return result
 
-        # Rate limiting delay (except for last email)
-        if i < len(emails) - 1:
-            time.sleep(delay_seconds)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(send_one, emails))
+
+
+def run_bulk_send_job(job_id: str, emails: List[Dict]):
+    """Background worker: send a bulk batch and record results on the job."""
+    job = bulk_jobs[job_id]
+    job["status"] = "running"
+
+    try:
+        results = send_bulk_emails(emails, delay_seconds=3)
+        success_count = sum(1 for r in results if r["success"])
+        job.update({
+            "status": "completed",
+            "success_count": success_count,
+            "failed_count": len(results) - success_count,
+            "results": results,
+        })
+    except Exception as e:
+        job.update({"status": "failed", "error": str(e)})
 
-    return results
+    job["completed_at"] = datetime.now().isoformat()
 
 
 # ============================================================================
@@ -1798,7 +1945,8 @@ def complete_gmail_oauth(code: str) -> dict:
 app = FastAPI(
     title="LeadSnipe API",
     description="API for LeadSnipe lead generation pipeline",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,  # orjson: faster list-of-dict payloads
 )
 
 # Enable CORS for local development
@@ -2113,12 +2261,17 @@ class InsightQuestionRequest(BaseModel):
     question: str = Field(..., example="What can I sell them?")
 
 class SendEmailRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
     to: str = Field(..., example="ceo@example.com")
     subject: str = Field(..., example="Quick question about your business")
     body: str = Field(..., example="Hi, I noticed...")
 
 class BulkSendRequest(BaseModel):
-    emails: List[SendEmailRequest]
+    model_config = ConfigDict(extra="forbid")
+
+    # Batch cap enforced by the validator (422) rather than in the handler
+    emails: List[SendEmailRequest] = Field(..., max_length=50)
 
 
 @app.get("/api/lead/{lead_id}/insights")
@@ -2226,39 +2379,72 @@ async def api_send_email(request: SendEmailRequest):
 
 @app.post("/api/email/send-bulk")
 async def api_send_bulk_emails(request: BulkSendRequest):
-    """Send multiple emails with rate limiting (3s delay)."""
-    if len(request.emails) > 50:
-        raise HTTPException(status_code=400, detail="Maximum 50 emails per batch")
-
+    """Queue multiple emails for background sending (max 50); poll the returned job."""
     emails = [{"to": e.to, "subject": e.subject, "body": e.body} for e in request.emails]
-    results = send_bulk_emails(emails, delay_seconds=3)
 
-    success_count = sum(1 for r in results if r["success"])
+    job_id = f"bulk_{uuid.uuid4().hex[:12]}"
+    store_bulk_job({
+        "job_id": job_id,
+        "status": "queued",
+        "total": len(emails),
+        "success_count": 0,
+        "failed_count": 0,
+        "results": [],
+        "started_at": datetime.now().isoformat(),
+        "completed_at": None,
+        "error": None,
+    })
+
+    # Send in a background thread so the request returns immediately
+    thread = threading.Thread(
+        target=run_bulk_send_job,
+        args=(job_id, emails),
+        daemon=True
+    )
+    thread.start()
 
     return {
-        "total": len(results),
-        "success_count": success_count,
-        "failed_count": len(results) - success_count,
-        "results": results
+        "job_id": job_id,
+        "status": "queued",
+        "total": len(emails),
+        "message": f"Bulk send started. Poll /api/email/bulk/{job_id} for results."
     }
 
 
+@app.get("/api/email/bulk/{job_id}")
+async def get_bulk_send_status(job_id: str):
+    """Get status and per-email results of a bulk send job."""
+    job = bulk_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Bulk send job not found")
+    return job
+
+
 @app.get("/api/hunts")
-async def list_hunts(user_id: Optional[str] = None):
-    """List all hunts (from database for persistence)."""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        if user_id:
-            cursor.execute('SELECT * FROM hunts WHERE user_id = ? ORDER BY started_at DESC', (user_id,))
-        else:
-            cursor.execute('SELECT * FROM hunts ORDER BY started_at DESC')
-        rows = cursor.fetchall()
-        all_hunts = [dict(row) for row in rows]
-    
-    return {
-        "hunts": all_hunts,
-        "total": len(all_hunts)
-    }
+async def list_hunts(request: Request, user_id: Optional[str] = None):
+    """
+    List all hunts (from database for persistence).
+    Dashboard polls are served from a short TTL cache and honor If-None-Match.
+    """
+    cached = hunts_cache_get(user_id)
+    if cached:
+        body, etag = cached
+    else:
+        generation = hunts_cache_generation
+        # Blocking SQLite read runs on a worker thread, off the event loop
+        all_hunts = await asyncio.to_thread(db_list_hunts, user_id)
+        body = orjson.dumps({
+            "hunts": all_hunts,
+            "total": len(all_hunts)
+        })
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        hunts_cache_put(user_id, body, etag, generation)
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 # ============================================================================
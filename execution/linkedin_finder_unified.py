@@ -14,16 +14,23 @@ Usage:
 
     finder = LinkedInFinder(workers=10)
     leads = finder.find_batch(leads, progress_callback=my_callback)
+
+    # Or from async code:
+    leads = await finder.find_batch_async(leads, progress_callback=my_callback)
 """
 
 import re
 import json
+import asyncio
 import threading
-from typing import Optional, Dict, List, Callable, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple, Callable, Any
 from urllib.parse import quote_plus, urlparse
-from dataclasses import dataclass
-import requests
+from dataclasses import dataclass, field
+from functools import partial
+
+import httpx
+from bs4 import BeautifulSoup
 
 from rate_limiter import RateLimiter, get_limiter
 
@@ -34,14 +41,15 @@ LINKEDIN_PROFILE_PATTERN = re.compile(
     re.IGNORECASE
 )
 
-LINKEDIN_COMPANY_PATTERN = re.compile(
-    r'https?://(?:www\.)?linkedin\.com/company/([a-zA-Z0-9_-]+)/?',
+# Google SERP: profile URLs either wrapped in /url?q= redirects or linked directly
+GOOGLE_LINKEDIN_PATTERN = re.compile(
+    r'(/url\?q=)?https?://(?:[a-z]{2}\.)?(?:www\.)?linkedin\.com/in/([a-zA-Z0-9_-]+)',
     re.IGNORECASE
 )
 
-# Name extraction pattern (First Last)
-NAME_PATTERN = re.compile(
-    r'\b([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b'
+LINKEDIN_COMPANY_PATTERN = re.compile(
+    r'https?://(?:www\.)?linkedin\.com/company/([a-zA-Z0-9_-]+)/?',
+    re.IGNORECASE
 )
 
 # False positive names to filter
@@ -59,21 +67,45 @@ FALSE_POSITIVE_NAMES = {
     'First Class', 'Good Tidings', 'Rich Plumbing', 'In Line',
 }
 
+# Stop reading a streamed search page after this many characters
+STREAM_MAX_CHARS = 256 * 1024
+
+# Seconds DuckDuckGo gets to answer before Google is queried alongside it
+GOOGLE_HEDGE_DELAY = 3.0
+
+# Max search results memoized per finder (franchises repeat the same name/city)
+SEARCH_CACHE_SIZE = 4096
+
+# Name extraction pattern (First Last)
+NAME_PATTERN = re.compile(
+    r'\b([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b'
+)
+
+# A matched name containing any false positive phrase is rejected whole (so
+# "New York Plumbing" yields nothing rather than "York Plumbing")
+FALSE_POSITIVE_NAME_RE = re.compile(r'\b(?:' + '|'.join(
+    re.escape(name) for name in sorted(FALSE_POSITIVE_NAMES, key=len, reverse=True)
+) + r')\b')
+
+# Single-pass scraped text scan: (in|company, slug) for LinkedIn URLs, or a name
+HTML_SCAN_PATTERN = re.compile(
+    r'(?i:https?://(?:www\.)?linkedin\.com/(in|company)/([a-zA-Z0-9_-]+))|'
+    + NAME_PATTERN.pattern
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class LinkedInResult:
-    """Result of LinkedIn discovery for a single lead."""
+    """
+    Result of LinkedIn discovery for a single lead.
+
+    owner_first_name is not derived automatically - set it alongside owner_name.
+    """
     linkedin_url: Optional[str] = None
     owner_name: Optional[str] = None
     owner_first_name: Optional[str] = None
     source: Optional[str] = None
-    names_found: List[str] = None
-
-    def __post_init__(self):
-        if self.names_found is None:
-            self.names_found = []
-        if self.owner_name and not self.owner_first_name:
-            self.owner_first_name = self.owner_name.split()[0]
+    names_found: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict:
         return {
@@ -89,10 +121,12 @@ class LinkedInFinder:
     """
     FREE multi-strategy LinkedIn discovery.
 
-    Strategies (in order, stops on first success):
+    Strategies (stops on first success):
     1. HTML extraction - From scraped website text (instant, no network)
     2. DuckDuckGo search - Free search engine
-    3. Google HTML search - Fallback search (more aggressive rate limiting)
+    3. Google HTML search - More aggressive rate limiting
+    Google is a hedge: it starts only when DuckDuckGo misses or is slow
+    (GOOGLE_HEDGE_DELAY), then the first engine to find a profile wins.
     """
 
     def __init__(self, workers: int = 10, verbose: bool = True):
@@ -108,6 +142,15 @@ class LinkedInFinder:
         self.limiter = get_limiter("duckduckgo")
         self.google_limiter = get_limiter("google")
 
+        # Shared keep-alive pool: one TLS handshake per host, reused by every search
+        self.limits = httpx.Limits(
+            max_keepalive_connections=workers,
+            max_connections=workers * 2,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        # Google searches that lost a race after being sent; drained by aclose()
+        self._background: set = set()
+
         # Stats
         self.stats = {
             "total": 0,
@@ -121,66 +164,124 @@ class LinkedInFinder:
         }
         self._stats_lock = threading.Lock()
 
+        # LRU of definitive search results: (engine, business, owner, location) -> result
+        self._search_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        # Same key -> future shared by concurrent lookups on one event loop
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._cache_lock = threading.Lock()
+
     def _log(self, message: str):
         """Print if verbose mode enabled."""
         if self.verbose:
             print(message, flush=True)
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the finder's HTTP/2 client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(http2=True, limits=self.limits, timeout=15.0)
+        return self._client
+
+    async def aclose(self):
+        """Close the persistent HTTP client (call when done with the finder)."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _run_sync(self, coro):
+        """Run a coroutine to completion, closing the client before the loop ends."""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(runner())
+
     # =========================================================================
     # Strategy 1: HTML Extraction (instant)
     # =========================================================================
 
-    def _extract_from_html(self, text: str) -> Optional[str]:
+    def _scan_html(self, text: str) -> Tuple[Optional[str], List[str]]:
         """
-        Extract LinkedIn URL from HTML/text content.
-        This is instant - no network request needed.
+        Extract LinkedIn URL and potential person names from HTML/text content
+        in a single regex pass. This is instant - no network request needed.
+
+        Returns:
+            (linkedin_url, up to 5 unique names in order of appearance)
         """
         if not text:
-            return None
-
-        # Look for LinkedIn profile URLs
-        matches = LINKEDIN_PROFILE_PATTERN.findall(text)
-        if matches:
-            username = matches[0]
-            # Filter out common false positives
-            if username.lower() not in {'share', 'company', 'jobs', 'feed', 'in'}:
-                return f"https://linkedin.com/in/{username}"
-
-        # Also check for company pages (might have owner info)
-        company_matches = LINKEDIN_COMPANY_PATTERN.findall(text)
-        if company_matches:
+            return None, []
+
+        profile = None
+        company = None
+        names: Dict[str, None] = {}  # Ordered set
+
+        for match in HTML_SCAN_PATTERN.finditer(text):
+            kind, slug, name = match.groups()
+
+            if name:
+                if len(names) < 5 and not FALSE_POSITIVE_NAME_RE.search(name):
+                    names.setdefault(name, None)
+            elif kind.lower() == 'in':
+                # Only the first profile URL counts, like the old findall()[0]
+                if profile is None:
+                    profile = slug
+            elif company is None:
+                company = slug
+
+            if (profile and profile.lower() not in {'share', 'company', 'jobs', 'feed', 'in'}
+                    and len(names) >= 5):
+                break
+
+        linkedin_url = None
+        # Filter out common false positives
+        if profile and profile.lower() not in {'share', 'company', 'jobs', 'feed', 'in'}:
+            linkedin_url = f"https://linkedin.com/in/{profile}"
+        elif company:
             # Company pages are less useful but still a signal
-            return f"https://linkedin.com/company/{company_matches[0]}"
+            linkedin_url = f"https://linkedin.com/company/{company}"
 
-        return None
+        return linkedin_url, list(names)
 
-    def _extract_names_from_text(self, text: str) -> List[str]:
-        """Extract potential person names from text."""
-        if not text:
-            return []
+    async def _read_until_hit(self, response: httpx.Response, pattern: re.Pattern,
+                              is_usable: Callable[[re.Match], bool]) -> str:
+        """
+        Read a streamed search page only until the first usable LinkedIn match
+        and its closing </a> have arrived, or STREAM_MAX_CHARS is reached.
+        Leaving the stream early drops the rest of the body unread.
+        """
+        html = ""
+        scan_from = 0
+
+        async for chunk in response.aiter_text():
+            html += chunk
 
-        names = NAME_PATTERN.findall(text)
-        filtered = [n for n in names if n not in FALSE_POSITIVE_NAMES]
+            for match in pattern.finditer(html, scan_from):
+                if is_usable(match) and html.find('</a>', match.end()) != -1:
+                    return html
 
-        # Deduplicate while preserving order
-        seen = set()
-        unique = []
-        for name in filtered:
-            if name.lower() not in seen:
-                seen.add(name.lower())
-                unique.append(name)
+            # Re-scan a small overlap so matches split across chunks are seen
+            scan_from = max(0, len(html) - 512)
+            if len(html) >= STREAM_MAX_CHARS:
+                break
 
-        return unique[:5]
+        return html
 
     # =========================================================================
     # Strategy 2: DuckDuckGo Search (free)
     # =========================================================================
 
-    def _search_duckduckgo(self, business_name: str, owner_name: Optional[str] = None,
-                           location: str = "") -> Dict:
+    async def _search_duckduckgo(self, client: httpx.AsyncClient, business_name: str,
+                                 owner_name: Optional[str] = None,
+                                 location: str = "") -> Tuple[Dict, bool]:
         """
         Search DuckDuckGo for LinkedIn profile.
         Uses HTML endpoint (no API needed, unlimited).
+
+        Returns:
+            (result, cacheable) - cacheable is False for errors and non-200 pages
         """
         result = {"linkedin_url": None, "owner_name": owner_name}
 
@@ -193,16 +294,24 @@ class LinkedInFinder:
         search_url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
 
         try:
-            headers = self.limiter.acquire("duckduckgo.com")
-            response = requests.get(search_url, headers=headers, timeout=15)
-            self.limiter.report_response("duckduckgo.com", response.status_code)
+            headers = await self.limiter.aacquire("duckduckgo.com")
+            async with client.stream("GET", search_url, headers=headers) as response:
+                self.limiter.report_response("duckduckgo.com", response.status_code)
+
+                if response.status_code != 200:
+                    return result, False
 
-            if response.status_code != 200:
-                return result
+                html = await self._read_until_hit(
+                    response, LINKEDIN_PROFILE_PATTERN,
+                    lambda m: m.group(1).lower() not in {'share', 'company', 'jobs', 'feed', 'in'},
+                )
+
+            # No LinkedIn link anywhere on the page - skip the HTML parse
+            if 'linkedin.com' not in html:
+                return result, True
 
             # Parse results
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
 
             # Find result links
             for link in soup.find_all('a', class_='result__a'):
@@ -222,29 +331,35 @@ class LinkedInFinder:
                             if len(potential_name.split()) >= 2:
                                 result["owner_name"] = potential_name
 
-                        return result
+                        return result, True
 
         except Exception as e:
             self._log(f"      DuckDuckGo error: {e}")
+            return result, False
 
-        return result
+        return result, True
 
     # =========================================================================
     # Strategy 3: Google HTML Search (fallback)
     # =========================================================================
 
-    def _search_google(self, business_name: str, owner_name: Optional[str] = None,
-                       location: str = "") -> Dict:
+    async def _search_google(self, client: httpx.AsyncClient, business_name: str,
+                             owner_name: Optional[str] = None, location: str = "",
+                             sent: Optional[asyncio.Event] = None) -> Tuple[Dict, bool]:
         """
         Search Google for LinkedIn profile.
-        More aggressive rate limiting to avoid blocks.
+        More aggressive rate limiting to avoid blocks. `sent` is set once the
+        limiter slot is taken - from then on the search has cost budget.
+
+        Returns:
+            (result, cacheable) - cacheable is False when skipped, blocked or failed
         """
         result = {"linkedin_url": None, "owner_name": owner_name}
 
         # Check if Google appears blocked
         if self.google_limiter.is_domain_blocked("google.com"):
             self._log("      Google appears blocked, skipping")
-            return result
+            return result, False
 
         # Build search query with site restriction
         if owner_name:
@@ -255,58 +370,163 @@ class LinkedInFinder:
         search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
 
         try:
-            headers = self.google_limiter.acquire("google.com")
+            headers = await self.google_limiter.aacquire("google.com")
+            if sent is not None:
+                sent.set()
             # Add referer for Google
             headers["Referer"] = "https://www.google.com/"
 
-            response = requests.get(search_url, headers=headers, timeout=15)
-            self.google_limiter.report_response("google.com", response.status_code)
-
-            if response.status_code != 200:
-                return result
-
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Find all links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-
-                # Google wraps links in /url?q=
-                if '/url?q=' in href:
-                    start = href.find('/url?q=') + 7
-                    end = href.find('&', start)
-                    if end == -1:
-                        end = len(href)
-                    actual_url = href[start:end]
-
-                    linkedin_match = LINKEDIN_PROFILE_PATTERN.search(actual_url)
-                    if linkedin_match:
-                        username = linkedin_match.group(1)
-                        if username.lower() not in {'share', 'company', 'jobs', 'feed', 'in'}:
-                            result["linkedin_url"] = f"https://linkedin.com/in/{username}"
-
-                            # Try to extract name from link text
-                            link_text = link.get_text(strip=True)
-                            if link_text and '-' in link_text:
-                                parts = link_text.split('-')
-                                potential_name = parts[0].strip()
-                                if len(potential_name.split()) >= 2:
-                                    result["owner_name"] = potential_name
-
-                            return result
-
-                # Direct LinkedIn URL check
-                elif 'linkedin.com/in/' in href:
-                    linkedin_match = LINKEDIN_PROFILE_PATTERN.search(href)
-                    if linkedin_match:
-                        result["linkedin_url"] = f"https://linkedin.com/in/{linkedin_match.group(1)}"
-                        return result
+            async with client.stream("GET", search_url, headers=headers) as response:
+                self.google_limiter.report_response("google.com", response.status_code)
+
+                if response.status_code != 200:
+                    return result, False
+
+                html = await self._read_until_hit(
+                    response, GOOGLE_LINKEDIN_PATTERN,
+                    lambda m: not (m.group(1) and
+                                   m.group(2).lower() in {'share', 'company', 'jobs', 'feed', 'in'}),
+                )
+
+            if 'linkedin.com/in/' not in html:
+                return result, True
+
+            # Scan the raw page; only parse HTML when we still need a name
+            for linkedin_match in GOOGLE_LINKEDIN_PATTERN.finditer(html):
+                wrapped, username = linkedin_match.groups()
+                if wrapped and username.lower() in {'share', 'company', 'jobs', 'feed', 'in'}:
+                    continue
+
+                result["linkedin_url"] = f"https://linkedin.com/in/{username}"
+
+                # Google wraps result links in /url?q= - link text holds the name
+                if wrapped and not owner_name:
+                    potential_name = self._name_from_google_link(html, username)
+                    if potential_name:
+                        result["owner_name"] = potential_name
+
+                return result, True
 
         except Exception as e:
             self._log(f"      Google error: {e}")
+            return result, False
 
-        return result
+        return result, True
+
+    async def _cached_search(self, engine: str, search: Callable, client: httpx.AsyncClient,
+                             business_name: str, owner_name: Optional[str],
+                             location: str) -> Dict:
+        """
+        Run a search strategy, reusing the result for duplicate businesses.
+
+        Only definitive answers are cached - errors, blocks and non-200 pages
+        are retried on the next call. Concurrent lookups of the same key on
+        one event loop share a single request; if that request is cancelled
+        (its race was lost), the waiters retry instead of taking a non-result.
+        """
+        key = (engine, business_name.lower().strip(), (owner_name or "").lower(), location.lower())
+
+        while True:
+            with self._cache_lock:
+                cached = self._search_cache.get(key)
+                if cached is not None:
+                    self._search_cache.move_to_end(key)
+                    return dict(cached)
+
+                loop = asyncio.get_running_loop()
+                pending = self._inflight.get(key)
+                if pending is None or pending.get_loop() is not loop:
+                    future = self._inflight[key] = loop.create_future()
+                    break
+
+            # wait() (unlike awaiting the future) doesn't raise if the owner is cancelled
+            await asyncio.wait({pending})
+            if not pending.cancelled():
+                return dict(pending.result())
+
+        try:
+            result, cacheable = await search(client, business_name, owner_name, location)
+            if cacheable:
+                with self._cache_lock:
+                    self._search_cache[key] = result
+                    if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                        self._search_cache.popitem(last=False)
+            future.set_result(result)
+            return dict(result)
+        finally:
+            with self._cache_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            if not future.done():
+                future.cancel()
+
+    def _name_from_google_link(self, html: str, username: str) -> Optional[str]:
+        """Pull "First Last - Title" name from the result link for a profile."""
+        soup = BeautifulSoup(html, 'html.parser')
+
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if '/url?q=' not in href or f"/in/{username}" not in href:
+                continue
+
+            link_text = link.get_text(strip=True)
+            if link_text and '-' in link_text:
+                potential_name = link_text.split('-')[0].strip()
+                if len(potential_name.split()) >= 2:
+                    return potential_name
+            return None
+
+        return None
+
+    async def _race_searches(self, client: httpx.AsyncClient, business_name: str,
+                             owner_name: Optional[str], location: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        Search DuckDuckGo, hedged with Google.
+
+        Google only starts once DuckDuckGo has missed or has not answered
+        within GOOGLE_HEDGE_DELAY seconds; after that the first engine to
+        return a LinkedIn URL wins (DuckDuckGo preferred on ties). A losing
+        Google search still waiting for its limiter slot is cancelled for
+        free; one already sent is left to finish so its answer is cached.
+
+        Returns:
+            (source, result dict) or (None, None) if neither found a profile
+        """
+        ddg = asyncio.create_task(self._cached_search(
+            "duckduckgo", self._search_duckduckgo, client, business_name, owner_name, location
+        ))
+        tasks = {ddg: "duckduckgo"}
+
+        done, _ = await asyncio.wait({ddg}, timeout=GOOGLE_HEDGE_DELAY)
+        if ddg in done and ddg.result().get("linkedin_url"):
+            return "duckduckgo", ddg.result()
+
+        google_sent = asyncio.Event()
+        google = asyncio.create_task(self._cached_search(
+            "google", partial(self._search_google, sent=google_sent),
+            client, business_name, owner_name, location
+        ))
+        tasks[google] = "google"
+        pending = {task for task in tasks if not task.done()}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in sorted(done, key=lambda t: tasks[t] != "duckduckgo"):
+                    search_result = task.result()
+                    if search_result.get("linkedin_url"):
+                        return tasks[task], search_result
+        finally:
+            for task in pending:
+                if task is google and google_sent.is_set():
+                    # Budget already spent - keep the answer for the cache
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+                else:
+                    task.cancel()
+
+        return None, None
 
     # =========================================================================
     # Main Discovery Method
@@ -314,6 +534,12 @@ class LinkedInFinder:
 
     def find_single(self, business_name: str, website: Optional[str] = None,
                     address: Optional[str] = None, scraped_text: Optional[str] = None) -> LinkedInResult:
+        """Sync wrapper around find_single_async()."""
+        return self._run_sync(self.find_single_async(business_name, website, address, scraped_text))
+
+    async def find_single_async(self, business_name: str, website: Optional[str] = None,
+                                address: Optional[str] = None,
+                                scraped_text: Optional[str] = None) -> LinkedInResult:
         """
         Find LinkedIn for a single business using all FREE strategies.
 
@@ -326,6 +552,7 @@ class LinkedInFinder:
         Returns:
             LinkedInResult with linkedin_url, owner_name, source
         """
+        client = self._get_client()
         result = LinkedInResult()
 
         # Extract location from address
@@ -337,47 +564,34 @@ class LinkedInFinder:
 
         # Strategy 1: Extract from scraped text (instant, no network)
         if scraped_text:
-            linkedin_url = self._extract_from_html(scraped_text)
+            linkedin_url, names = self._scan_html(scraped_text)
             if linkedin_url:
                 result.linkedin_url = linkedin_url
                 result.source = "html_extract"
                 self._log(f"      [HTML] Found: {linkedin_url}")
 
-            # Also extract potential owner names
-            names = self._extract_names_from_text(scraped_text)
+            # Also use potential owner names
             if names:
                 result.names_found = names
                 if not result.owner_name:
                     result.owner_name = names[0]
                     result.owner_first_name = names[0].split()[0]
 
-        # Strategy 2: DuckDuckGo search (if no LinkedIn yet)
+        # Strategies 2 + 3: DuckDuckGo, hedged with Google (if no LinkedIn yet)
         if not result.linkedin_url:
-            self._log(f"      [DDG] Searching...")
-            ddg_result = self._search_duckduckgo(business_name, result.owner_name, location)
+            self._log(f"      [DDG+Google] Searching...")
+            source, search_result = await self._race_searches(
+                client, business_name, result.owner_name, location
+            )
 
-            if ddg_result.get("linkedin_url"):
-                result.linkedin_url = ddg_result["linkedin_url"]
-                result.source = "duckduckgo"
-                self._log(f"      [DDG] Found: {result.linkedin_url}")
+            if source:
+                result.linkedin_url = search_result["linkedin_url"]
+                result.source = source
+                self._log(f"      [{source}] Found: {result.linkedin_url}")
 
-                if ddg_result.get("owner_name") and not result.owner_name:
-                    result.owner_name = ddg_result["owner_name"]
-                    result.owner_first_name = ddg_result["owner_name"].split()[0]
-
-        # Strategy 3: Google search (fallback, conservative)
-        if not result.linkedin_url:
-            self._log(f"      [Google] Fallback search...")
-            google_result = self._search_google(business_name, result.owner_name, location)
-
-            if google_result.get("linkedin_url"):
-                result.linkedin_url = google_result["linkedin_url"]
-                result.source = "google"
-                self._log(f"      [Google] Found: {result.linkedin_url}")
-
-                if google_result.get("owner_name") and not result.owner_name:
-                    result.owner_name = google_result["owner_name"]
-                    result.owner_first_name = google_result["owner_name"].split()[0]
+                if search_result.get("owner_name") and not result.owner_name:
+                    result.owner_name = search_result["owner_name"]
+                    result.owner_first_name = search_result["owner_name"].split()[0]
 
         if not result.linkedin_url:
             self._log(f"      [!] No LinkedIn found")
@@ -389,8 +603,13 @@ class LinkedInFinder:
     # =========================================================================
 
     def find_batch(self, leads: List[Dict], progress_callback: Optional[Callable] = None) -> List[Dict]:
+        """Sync wrapper around find_batch_async() for non-async callers."""
+        return self._run_sync(self.find_batch_async(leads, progress_callback))
+
+    async def find_batch_async(self, leads: List[Dict],
+                               progress_callback: Optional[Callable] = None) -> List[Dict]:
         """
-        Find LinkedIn for all leads in parallel using FREE methods only.
+        Find LinkedIn for all leads concurrently using FREE methods only.
 
         Args:
             leads: List of lead dicts with at least 'name' field
@@ -402,10 +621,11 @@ class LinkedInFinder:
         total = len(leads)
         self._log(f"\n[LinkedIn Finder] Processing {total} leads ({self.workers} workers)")
 
-        completed = [0]  # Mutable counter for thread safety
+        # Batch-local counters: every lead runs on this event loop, so no lock is
+        # needed until the single merge into self.stats at the end
+        batch_stats = {"total": 0, "linkedin_found": 0, "owner_found": 0, "by_source": {}}
 
-        def process_single(idx_lead):
-            idx, lead = idx_lead
+        async def process_single(idx: int, lead: Dict):
             business_name = lead.get("name", "Unknown")
             website = lead.get("website")
             address = lead.get("address", "")
@@ -413,7 +633,7 @@ class LinkedInFinder:
 
             self._log(f"[{idx}/{total}] {business_name[:40]}")
 
-            result = self.find_single(business_name, website, address, scraped_text)
+            result = await self.find_single_async(business_name, website, address, scraped_text)
 
             # Update lead in place
             lead["linkedin_url"] = result.linkedin_url
@@ -421,36 +641,39 @@ class LinkedInFinder:
             lead["owner_first_name"] = result.owner_first_name or lead.get("owner_first_name")
             lead["linkedin_source"] = result.source
 
-            # Thread-safe stats update
-            with self._stats_lock:
-                self.stats["total"] += 1
-                if result.linkedin_url:
-                    self.stats["linkedin_found"] += 1
-                    if result.source:
-                        self.stats["by_source"][result.source] = \
-                            self.stats["by_source"].get(result.source, 0) + 1
-                if result.owner_name:
-                    self.stats["owner_found"] += 1
-
-                completed[0] += 1
+            batch_stats["total"] += 1
+            if result.linkedin_url:
+                batch_stats["linkedin_found"] += 1
+                if result.source:
+                    batch_stats["by_source"][result.source] = \
+                        batch_stats["by_source"].get(result.source, 0) + 1
+            if result.owner_name:
+                batch_stats["owner_found"] += 1
 
             if progress_callback:
-                progress_callback(completed[0], total)
-
-            return lead
+                progress_callback(batch_stats["total"], total)
 
-        # Parallel processing
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            futures = {executor.submit(process_single, (i, lead)): i
-                       for i, lead in enumerate(leads, 1)}
+        # Fixed pool of worker coroutines sharing one iterator: each lead is
+        # taken by exactly one worker, with no per-lead task or semaphore
+        pending_leads = enumerate(leads, 1)
 
-            for future in as_completed(futures):
+        async def worker():
+            for idx, lead in pending_leads:
                 try:
-                    future.result()
+                    await process_single(idx, lead)
                 except Exception as e:
-                    idx = futures[future]
                     self._log(f"      Error processing lead {idx}: {e}")
 
+        # Concurrent processing over the finder's pooled client
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, total))))
+
+        # Merge batch counters in one critical section
+        with self._stats_lock:
+            for key in ("total", "linkedin_found", "owner_found"):
+                self.stats[key] += batch_stats[key]
+            for source, count in batch_stats["by_source"].items():
+                self.stats["by_source"][source] = self.stats["by_source"].get(source, 0) + count
+
         # Print summary
         self._log(f"\n[LinkedIn Finder] Summary:")
         self._log(f"   Total processed: {self.stats['total']}")
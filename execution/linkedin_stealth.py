@@ -31,11 +31,21 @@ CLI:
     python linkedin_stealth.py "John Smith" "Acme Corp"
 """
 
+import os
 import re
+import time
+import atexit
+import sqlite3
 import asyncio
+import threading
+import concurrent.futures
 import random
+import urllib.parse
+from collections import OrderedDict
+from contextlib import AsyncExitStack, suppress
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Callable
+from enum import Enum
+from typing import Optional, Dict, List, Callable, Tuple, Awaitable, AsyncIterator
 from functools import partial
 
 try:
@@ -51,6 +61,12 @@ try:
 except ImportError:
     HAS_HTTPX = False
 
+try:
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 
 # =============================================================================
 # Constants and Patterns
@@ -64,6 +80,18 @@ LINKEDIN_PROFILE_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# A bare profile URL, or a DuckDuckGo redirect whose uddg= param (usually
+# percent-encoded) holds one - the username is group 1 or group 2
+_LINKEDIN_HREF_RE = re.compile(
+    r'[?&]uddg=https?(?:%3A%2F%2F|://)(?:[a-z]{2}\.)?(?:www\.)?(?:mobile\.)?linkedin\.com(?:%2F|/)in(?:%2F|/)'
+    r'([a-zA-Z0-9_-]+)(?:%2F|/)?(?:(?:%3F|\?)[^&]*)?(?:&|$)'
+    r'|^https?://(?:[a-z]{2}\.)?(?:www\.)?(?:mobile\.)?linkedin\.com/in/([a-zA-Z0-9_-]+)/?(?:\?.*)?$',
+    re.IGNORECASE
+)
+
+# Canonical form every extracted profile URL is normalized to
+_LINKEDIN_URL_PREFIX = "https://linkedin.com/in/"
+
 # Usernames that are not real profiles (common LinkedIn paths to filter)
 INVALID_USERNAMES = frozenset({
     'share',
@@ -95,6 +123,11 @@ USER_AGENTS = [
 ]
 
 
+# In-process search memoization (shared by DDG and Bing)
+SEARCH_CACHE_SIZE = 4096
+NEGATIVE_CACHE_TTL = 3600.0  # Seconds a known-empty search is remembered
+
+
 @dataclass
 class LinkedInResult:
     """Result of a LinkedIn profile discovery."""
@@ -115,10 +148,279 @@ class LinkedInResult:
         }
 
 
+# =============================================================================
+# Search Result Cache
+# =============================================================================
+
+class SearchStatus(str, Enum):
+    """Outcome of one engine's search for a (name, company)."""
+    FOUND = "found"
+    EMPTY = "empty"      # Search completed, no profile exists
+    BLOCKED = "blocked"  # Rate-limited, CAPTCHA, error, or never searched
+
+
+# key -> (expires_at or None, result dict or None)
+_search_cache: "OrderedDict[Tuple[str, str, str], Tuple[Optional[float], Optional[Dict]]]" = OrderedDict()
+# key -> future shared by concurrent lookups of the same key
+_inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+
+def _lead_key(name: Optional[str], company: Optional[str]) -> Tuple[str, str]:
+    """Normalize a (name, company) pair for cache and dedupe lookups."""
+    return (' '.join((name or '').split()).lower(), ' '.join((company or '').split()).lower())
+
+
+def _cache_get(key: Tuple[str, str, str]) -> Tuple[bool, Optional[Dict]]:
+    """Return (hit, value) for a cached search, expiring stale negatives."""
+    entry = _search_cache.get(key)
+    if entry is None:
+        return False, None
+
+    expires_at, value = entry
+    if expires_at is not None and expires_at < time.monotonic():
+        del _search_cache[key]
+        return False, None
+
+    _search_cache.move_to_end(key)
+    return True, value
+
+
+def _cache_put(key: Tuple[str, str, str], value: Optional[Dict]) -> None:
+    """Store a search result; negatives expire after NEGATIVE_CACHE_TTL."""
+    expires_at = None if value is not None else time.monotonic() + NEGATIVE_CACHE_TTL
+    _search_cache[key] = (expires_at, value)
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+
+
+async def _memoized_search(
+    key: Tuple[str, str, str],
+    fetch: Callable[[], Awaitable[Tuple[SearchStatus, Optional[Dict]]]],
+) -> Tuple[SearchStatus, Optional[Dict]]:
+    """
+    Run a search through the in-process cache.
+
+    fetch() returns (status, result). Only definitive answers (FOUND/EMPTY)
+    are cached - BLOCKED requests are retried on the next call. Concurrent
+    calls for the same key share one request; if its caller is cancelled,
+    the others retry rather than take a non-result.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        hit, value = _cache_get(key)
+        if hit:
+            return (SearchStatus.FOUND if value else SearchStatus.EMPTY), value
+
+        pending = _inflight.get(key)
+        if pending is None or pending.get_loop() is not loop:
+            break
+
+        # wait() (unlike awaiting the future) doesn't raise if the owner is cancelled
+        await asyncio.wait({pending})
+        if not pending.cancelled():
+            return pending.result()
+
+    future = _inflight[key] = loop.create_future()
+    try:
+        outcome = await fetch()
+        if outcome[0] is not SearchStatus.BLOCKED:
+            _cache_put(key, outcome[1])
+        future.set_result(outcome)
+        return outcome
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+        if not future.done():
+            future.cancel()
+
+
+class LinkedInCache:
+    """
+    Persistent sqlite cache of find_linkedin results, misses included.
+
+    Found profiles are kept for positive_ttl (7 days) and misses for
+    negative_ttl (1 day), so re-running a batch on the same CSV skips the
+    network for leads that were already resolved. Keys are the lowercased,
+    whitespace-collapsed (name, company). One connection per instance,
+    shared across threads behind a lock.
+
+    Example:
+        cache = LinkedInCache()
+        results = await find_linkedin_batch(leads, cache=cache)
+    """
+
+    DEFAULT_PATH = ".tmp/linkedin_cache.db"
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        positive_ttl: int = 7 * 24 * 3600,
+        negative_ttl: int = 24 * 3600,
+    ):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS linkedin_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                name TEXT,
+                title TEXT,
+                source TEXT,
+                ts INTEGER
+            )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def _key(name: str, company: str) -> str:
+        return '\t'.join(_lead_key(name, company))
+
+    def get(self, name: str, company: str) -> Optional[LinkedInResult]:
+        """Return the cached result, or None if missing or expired."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, name, title, source, ts FROM linkedin_cache WHERE key = ?",
+                (self._key(name, company),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        url, owner_name, owner_title, source, ts = row
+        ttl = self.positive_ttl if url else self.negative_ttl
+        if time.time() - ts > ttl:
+            return None
+
+        return LinkedInResult(
+            linkedin_url=url,
+            owner_name=owner_name,
+            owner_title=owner_title,
+            source=source or "",
+            confidence=DEFAULT_CONFIDENCE if url else 0.0,
+        )
+
+    def set(self, name: str, company: str, result: LinkedInResult) -> None:
+        """Store a result (an empty LinkedInResult records a miss)."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO linkedin_cache (key, url, name, title, source, ts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self._key(name, company),
+                    result.linkedin_url,
+                    result.owner_name,
+                    result.owner_title,
+                    result.source,
+                    int(time.time()),
+                ),
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+# =============================================================================
+# Adaptive Concurrency (AIMD)
+# =============================================================================
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency window for batch searches, modeled on TCP congestion control.
+
+    Every finished lookup grows the window additively (about
+    increase_on_success slots per full window of lookups); every rate-limit
+    signal from DDG or Bing shrinks it by decrease_factor. Workers hold a slot
+    while searching, so at most int(current) lookups run at once.
+
+    Example:
+        limiter = AdaptiveLimiter(initial=5, maximum=20)
+        results = await find_linkedin_batch(leads, limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        initial: int = 5,
+        minimum: int = 1,
+        maximum: int = 20,
+        increase_on_success: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        self.min = max(1, minimum)
+        self.max = max(self.min, maximum)
+        self.current = float(min(max(initial, self.min), self.max))
+        self.increase_on_success = increase_on_success
+        self.decrease_factor = decrease_factor
+        self.active = 0
+        # Lookups in flight at the last back-off saw the old window; their
+        # rate-limit signals are ignored so one burst halves the window once
+        self._since_decrease = 0
+        self._holdoff = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self.current)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot in the current window."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self, finished: bool = True) -> None:
+        """Free a slot; a finished lookup grows the window additively."""
+        async with self._cond:
+            self.active -= 1
+            if finished:
+                self._since_decrease += 1
+                self.current = min(self.max, self.current + self.increase_on_success / self.current)
+            self._cond.notify_all()
+
+    def record_rate_limit(self) -> None:
+        """Shrink the window multiplicatively after a 202/403/429/CAPTCHA."""
+        if self._since_decrease < self._holdoff:
+            return
+        self.current = max(self.min, self.current * self.decrease_factor)
+        self._since_decrease = 0
+        self._holdoff = self.active
+
+
 # =============================================================================
 # Task 4.1: DuckDuckGo LinkedIn Search
 # =============================================================================
 
+# Dedicated threads for blocking DDGS calls, so batches don't queue behind
+# other work on the loop's default executor
+_DDG_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix='ddg')
+atexit.register(_DDG_EXEC.shutdown)
+
+# One DDGS session per _DDG_EXEC thread (DDGS is not thread-safe)
+_ddg_local = threading.local()
+
+
+def _get_ddgs() -> "DDGS":
+    """Return the calling thread's DDGS instance, creating it on first use."""
+    ddgs = getattr(_ddg_local, 'ddgs', None)
+    if ddgs is None:
+        ddgs = _ddg_local.ddgs = DDGS()
+    return ddgs
+
+
+def _is_invalid_username(username: str) -> bool:
+    """Check a profile slug against INVALID_USERNAMES (all lowercase)."""
+    # Slugs are almost always lowercase already; skip the copy for those
+    if not username.islower():
+        username = username.lower()
+    return username in INVALID_USERNAMES
+
+
 def _is_valid_linkedin_url(url: str) -> bool:
     """
     Check if URL is a valid LinkedIn profile URL.
@@ -128,12 +430,15 @@ def _is_valid_linkedin_url(url: str) -> bool:
     if not url:
         return False
 
+    # Cheap substring reject before running the regex
+    if 'linkedin.com/in/' not in url.lower():
+        return False
+
     match = LINKEDIN_PROFILE_PATTERN.match(url)
     if not match:
         return False
 
-    username = match.group(1).lower()
-    return username not in INVALID_USERNAMES
+    return not _is_invalid_username(match.group(1))
 
 
 def _extract_linkedin_url(href: str) -> Optional[str]:
@@ -145,70 +450,86 @@ def _extract_linkedin_url(href: str) -> Optional[str]:
     if not href:
         return None
 
-    # Handle DuckDuckGo redirect URLs
-    if 'uddg=' in href:
-        # Extract actual URL from DDG tracking
-        import urllib.parse
-        parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-        if 'uddg' in parsed:
-            href = parsed['uddg'][0]
+    # Most search-result hrefs are non-LinkedIn noise; reject them with
+    # substring checks before running the regex
+    if 'uddg=' not in href and 'linkedin.com/in/' not in href.lower():
+        return None
 
-    match = LINKEDIN_PROFILE_PATTERN.match(href)
+    # One scan covers both direct links and DuckDuckGo redirect URLs
+    match = _LINKEDIN_HREF_RE.search(href)
     if match:
-        username = match.group(1)
-        if username.lower() not in INVALID_USERNAMES:
-            return f"https://linkedin.com/in/{username}/"
+        username = match.group(1) or match.group(2)
+        if not _is_invalid_username(username):
+            return f"{_LINKEDIN_URL_PREFIX}{username}/"
 
     return None
 
 
-async def search_duckduckgo(name: str, company: str, max_retries: int = 3) -> Optional[Dict]:
+async def search_duckduckgo(
+    name: str,
+    company: str,
+    max_retries: int = 3,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> Tuple[SearchStatus, Optional[Dict]]:
     """
     Search DuckDuckGo for LinkedIn profiles.
 
     Uses site:linkedin.com/in search with name and company.
-    Runs DDGS in thread executor for async compatibility.
+    Runs DDGS on the dedicated _DDG_EXEC thread pool for async compatibility.
+    Results are memoized per (name, company); see _memoized_search.
 
     Args:
         name: Person's name to search for
         company: Company name for context
         max_retries: Number of retry attempts on rate limit (default 3)
+        limiter: Optional AdaptiveLimiter notified of rate limits
 
     Returns:
-        Dict with keys: href, title, body - or None if not found
+        (status, result) - result is a dict with keys href, title, body when
+        status is FOUND, else None. EMPTY means DDG answered with no profile;
+        BLOCKED means rate-limited, failed, or not searched at all.
 
     Example:
-        result = await search_duckduckgo("John Smith", "Acme Corp")
-        if result:
+        status, result = await search_duckduckgo("John Smith", "Acme Corp")
+        if status is SearchStatus.FOUND:
             print(f"Found: {result['href']}")
     """
     if not HAS_DDG:
-        return None
+        return SearchStatus.BLOCKED, None
 
     if not name or not company:
-        return None
+        return SearchStatus.BLOCKED, None
+
+    return await _memoized_search(
+        ('duckduckgo',) + _lead_key(name, company),
+        partial(_fetch_duckduckgo, name, company, max_retries, limiter),
+    )
+
 
+async def _fetch_duckduckgo(
+    name: str,
+    company: str,
+    max_retries: int,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> Tuple[SearchStatus, Optional[Dict]]:
+    """Uncached DDG lookup. Returns (status, result)."""
     # Build search query
     query = f'site:linkedin.com/in "{name}" "{company}"'
 
     def _do_search():
-        """Synchronous DDG search to run in executor."""
-        try:
-            ddgs = DDGS()
-            results = ddgs.text(query, backend="html", max_results=5)
-            return list(results) if results else []
-        except Exception:
-            return []
+        """Synchronous DDG search to run in executor (errors propagate)."""
+        results = _get_ddgs().text(query, backend="html", max_results=5)
+        return list(results) if results else []
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     for attempt in range(max_retries):
         try:
-            # Run sync DDGS in thread executor
-            results = await loop.run_in_executor(None, _do_search)
+            # Run sync DDGS in the dedicated thread pool
+            results = await loop.run_in_executor(_DDG_EXEC, _do_search)
 
             if not results:
-                return None
+                return SearchStatus.EMPTY, None
 
             # Filter to valid LinkedIn profile URLs
             for result in results:
@@ -216,43 +537,48 @@ async def search_duckduckgo(name: str, company: str, max_retries: int = 3) -> Op
                 linkedin_url = _extract_linkedin_url(href)
 
                 if linkedin_url:
-                    return {
+                    return SearchStatus.FOUND, {
                         'href': linkedin_url,
                         'title': result.get('title', ''),
                         'body': result.get('body', ''),
                     }
 
             # No valid LinkedIn URLs found
-            return None
+            return SearchStatus.EMPTY, None
 
         except Exception as e:
             error_str = str(e).lower()
 
             # Check for rate limiting (202 status or rate limit message)
             if '202' in error_str or 'rate' in error_str:
+                if limiter:
+                    limiter.record_rate_limit()
                 if attempt < max_retries - 1:
                     # Exponential backoff: 2s, 4s, 8s
                     wait_time = 2 ** (attempt + 1)
                     await asyncio.sleep(wait_time)
                     continue
 
-            # Other errors - return None
-            return None
+            # Other errors - treat as blocked so Bing gets a try
+            return SearchStatus.BLOCKED, None
 
-    return None
+    return SearchStatus.BLOCKED, None
 
 
 # =============================================================================
 # Task 4.2: Snippet Name/Title Extraction
 # =============================================================================
 
-# Common LinkedIn title suffixes to strip
-LINKEDIN_SUFFIXES = [
-    ' | LinkedIn',
-    ' - LinkedIn',
-    ' on LinkedIn',
-    ' LinkedIn',
-]
+# Common LinkedIn title suffixes to strip:
+# ' | LinkedIn', ' - LinkedIn', ' on LinkedIn', ' LinkedIn'
+# (whitespace required before them, so a bare "LinkedIn" title is kept)
+_LINKEDIN_SUFFIX_RE = re.compile(r'\s+(?:[|-]\s*|on\s+)?LinkedIn\s*$', re.IGNORECASE)
+
+# "Name - Title - ..." / "Name | Title | ...": name and title in one scan
+_SNIPPET_RE = re.compile(r'^(?P<name>.+?)(?: [-|] (?P<title>.+?))?(?: [-|] .*)?$', re.DOTALL)
+
+# "Title at Company" separator
+_AT_RE = re.compile(r'\s+at\s+', re.IGNORECASE)
 
 # Patterns for name validation
 NAME_MIN_LENGTH = 3
@@ -269,12 +595,7 @@ def _clean_linkedin_title(title: str) -> str:
     if not title:
         return ""
 
-    cleaned = title.strip()
-    for suffix in LINKEDIN_SUFFIXES:
-        if cleaned.lower().endswith(suffix.lower()):
-            cleaned = cleaned[:-len(suffix)].strip()
-
-    return cleaned
+    return _LINKEDIN_SUFFIX_RE.sub('', title.strip()).strip()
 
 
 def _is_valid_name(name: str) -> bool:
@@ -302,19 +623,16 @@ def _is_valid_name(name: str) -> bool:
         return False
 
     # Not all uppercase (unless 2 letters like initials)
-    if name.isupper() and len(name) > 4:
+    if len(name) > 4 and name.isupper():
         return False
 
-    # At least one word should be capitalized (not all lowercase)
-    has_capitalized = any(
-        word[0].isupper()
-        for word in words
-        if word and word[0].isalpha()
-    )
-    if not has_capitalized:
-        return False
+    # At least one word should be capitalized (not all lowercase);
+    # split() never yields empty words, and isupper() implies a letter
+    for word in words:
+        if word[0].isupper():
+            return True
 
-    return True
+    return False
 
 
 def _extract_name_from_title(title_part: str) -> Optional[str]:
@@ -325,8 +643,7 @@ def _extract_name_from_title(title_part: str) -> Optional[str]:
     name = title_part.strip()
 
     # Handle case where name has trailing comma
-    if ',' in name:
-        name = name.split(',')[0].strip()
+    name = name.partition(',')[0].strip()
 
     # Validate
     if _is_valid_name(name):
@@ -343,13 +660,12 @@ def _extract_title_from_part(title_part: str) -> Optional[str]:
     title = title_part.strip()
 
     # Handle "Title at Company" format
-    if ' at ' in title.lower():
-        idx = title.lower().find(' at ')
-        title = title[:idx].strip()
+    at = _AT_RE.search(title)
+    if at:
+        title = title[:at.start()]
 
     # Handle trailing commas
-    if ',' in title:
-        title = title.split(',')[0].strip()
+    title = title.partition(',')[0].strip()
 
     # Basic validation - not empty, reasonable length
     if title and 2 < len(title) < 100:
@@ -385,42 +701,33 @@ def parse_linkedin_snippet(title: str, body: str) -> Dict[str, Optional[str]]:
     """
     result = {'name': None, 'title': None}
 
-    try:
-        if not title:
-            return result
+    # Never throw on malformed input: everything below is plain str work
+    if not title or not isinstance(title, str):
+        return result
 
-        # Clean LinkedIn branding
-        cleaned = _clean_linkedin_title(title)
-        if not cleaned:
-            return result
+    # Clean LinkedIn branding
+    cleaned = _clean_linkedin_title(title)
+    if not cleaned:
+        return result
 
-        # Split by common delimiters
-        # Try ' - ' first (most common), then ' | '
-        if ' - ' in cleaned:
-            parts = cleaned.split(' - ')
-        elif ' | ' in cleaned:
-            parts = cleaned.split(' | ')
-        else:
-            # No delimiter - whole thing might be a name
-            if _is_valid_name(cleaned):
-                result['name'] = cleaned
-            return result
+    # Split on the first ' - ' or ' | ' delimiters
+    name_part, title_part = _SNIPPET_RE.match(cleaned).group('name', 'title')
 
-        # First part is typically the name
-        if parts:
-            name = _extract_name_from_title(parts[0])
-            if name:
-                result['name'] = name
+    if title_part is None:
+        # No delimiter - whole thing might be a name
+        if _is_valid_name(name_part):
+            result['name'] = name_part
+        return result
 
-        # Second part (if exists) is typically the title
-        if len(parts) > 1:
-            job_title = _extract_title_from_part(parts[1])
-            if job_title:
-                result['title'] = job_title
+    # First part is typically the name
+    name = _extract_name_from_title(name_part)
+    if name:
+        result['name'] = name
 
-    except Exception:
-        # Never throw on malformed input
-        pass
+    # Second part is typically the title
+    job_title = _extract_title_from_part(title_part)
+    if job_title:
+        result['title'] = job_title
 
     return result
 
@@ -432,35 +739,135 @@ def parse_linkedin_snippet(title: str, body: str) -> Dict[str, Optional[str]]:
 # Bing search URL
 BING_SEARCH_URL = "https://www.bing.com/search"
 
+# Only q varies between requests
+_BING_URL_TEMPLATE = BING_SEARCH_URL + "?q={q}&count=10"
+
 # Minimum delay between Bing requests (seconds)
 BING_MIN_DELAY = 3.0
 BING_MAX_DELAY = 5.0
 
+# Markers of a Bing bot-check page
+BING_BLOCK_MARKERS = ('captcha', 'unusual traffic')
+
+
+def _new_http_client() -> "httpx.AsyncClient":
+    """
+    Create the pooled HTTP/2 client used for Bing requests.
+
+    find_linkedin_batch opens one for the whole batch so every lookup reuses
+    the same TLS connections; standalone calls open a short-lived one.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        timeout=15.0,
+        follow_redirects=True,
+    )
+
+
+# Fixed Bing request headers; User-Agent is filled in per request
+_BASE_BING_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Referer': 'https://www.bing.com/',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+def _shuffled_user_agents():
+    """Yield USER_AGENTS forever, reshuffled on every pass so the order never repeats exactly."""
+    while True:
+        yield from random.sample(USER_AGENTS, len(USER_AGENTS))
+
+
+_UA_CYCLE = _shuffled_user_agents()
+
 
 def _get_bing_headers() -> Dict[str, str]:
     """
     Get realistic headers for Bing requests.
 
-    Uses random user agent rotation to avoid detection.
+    Rotates user agents from a reshuffled cycle to avoid detection.
+    """
+    headers = _BASE_BING_HEADERS.copy()
+    headers['User-Agent'] = next(_UA_CYCLE)
+    return headers
+
+
+# XPath equivalents of li.b_algo, (h2 a)[href] and div.b_caption p
+_BING_RESULT_XPATH = "//li[contains(concat(' ', normalize-space(@class), ' '), ' b_algo ')]"
+_BING_LINK_XPATH = "(.//h2)[1]//a[@href]"
+_BING_CAPTION_XPATH = "(.//div[contains(concat(' ', normalize-space(@class), ' '), ' b_caption ')])[1]//p"
+
+
+def _extract_linkedin_from_bing_node(node) -> Optional[Dict]:
     """
-    user_agent = random.choice(USER_AGENTS)
+    Extract LinkedIn URL and metadata from an lxml Bing result node.
+
+    Args:
+        node: lxml element (li.b_algo)
+
+    Returns:
+        Dict with href, title, body or None
+    """
+    links = node.xpath(_BING_LINK_XPATH)
+    if not links:
+        return None
+
+    link = links[0]
+
+    # Validate it's a LinkedIn profile URL
+    linkedin_url = _extract_linkedin_url(link.get('href', ''))
+    if not linkedin_url:
+        return None
+
+    captions = node.xpath(_BING_CAPTION_XPATH)
+    body = captions[0].text_content().strip() if captions else ""
 
     return {
-        'User-Agent': user_agent,
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Referer': 'https://www.bing.com/',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
+        'href': linkedin_url,
+        'title': link.text_content().strip(),
+        'body': body,
     }
 
 
+def _parse_bing_results(html_text: str) -> Optional[Dict]:
+    """
+    Return the first LinkedIn profile result on a Bing results page.
+
+    Uses lxml (C parser) when available, BeautifulSoup otherwise.
+    """
+    if not html_text or not html_text.strip():
+        return None
+
+    if HAS_LXML:
+        tree = lxml_html.fromstring(html_text)
+        for node in tree.xpath(_BING_RESULT_XPATH):
+            result = _extract_linkedin_from_bing_node(node)
+            if result:
+                return result
+        return None
+
+    soup = BeautifulSoup(html_text, 'html.parser')
+
+    # Find search results (li.b_algo > h2 a)
+    for result_elem in soup.find_all('li', class_='b_algo'):
+        result = _extract_linkedin_from_bing_result(result_elem)
+        if result:
+            return result
+
+    return None
+
+
 def _extract_linkedin_from_bing_result(element) -> Optional[Dict]:
     """
     Extract LinkedIn URL and metadata from a Bing search result element.
 
+    BeautifulSoup fallback for _extract_linkedin_from_bing_node.
+
     Args:
         element: BeautifulSoup element (li.b_algo)
 
@@ -470,42 +877,43 @@ def _extract_linkedin_from_bing_result(element) -> Optional[Dict]:
     try:
         # Find the title link
         h2 = element.find('h2')
-        if not h2:
-            return None
-
-        link = h2.find('a', href=True)
-        if not link:
-            return None
-
-        href = link.get('href', '')
+        link = h2.find('a', href=True) if h2 else None
+        href = link.get('href', '') if link else ''
+    except (AttributeError, KeyError):
+        return None
 
-        # Validate it's a LinkedIn profile URL
-        linkedin_url = _extract_linkedin_url(href)
-        if not linkedin_url:
-            return None
+    if not isinstance(href, str):
+        return None
 
-        # Get title text
-        title = link.get_text(strip=True)
+    # Validate it's a LinkedIn profile URL
+    linkedin_url = _extract_linkedin_url(href)
+    if not linkedin_url:
+        return None
 
-        # Get snippet/body (usually in p tag or div.b_caption)
-        body = ""
-        caption = element.find('div', class_='b_caption')
-        if caption:
-            p = caption.find('p')
-            if p:
-                body = p.get_text(strip=True)
+    # Get title text
+    title = link.get_text(strip=True)
 
-        return {
-            'href': linkedin_url,
-            'title': title,
-            'body': body,
-        }
+    # Get snippet/body (usually in p tag or div.b_caption)
+    body = ""
+    caption = element.find('div', class_='b_caption')
+    if caption:
+        p = caption.find('p')
+        if p:
+            body = p.get_text(strip=True)
 
-    except Exception:
-        return None
+    return {
+        'href': linkedin_url,
+        'title': title,
+        'body': body,
+    }
 
 
-async def search_bing(name: str, company: str) -> Optional[Dict]:
+async def search_bing(
+    name: str,
+    company: str,
+    client: Optional["httpx.AsyncClient"] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> Tuple[SearchStatus, Optional[Dict]]:
     """
     Search Bing for LinkedIn profiles as fallback when DDG fails.
 
@@ -515,73 +923,120 @@ async def search_bing(name: str, company: str) -> Optional[Dict]:
     Args:
         name: Person's name to search for
         company: Company name for context
+        client: Shared httpx.AsyncClient (a temporary one is opened if None)
+        limiter: Optional AdaptiveLimiter notified of 403/429/CAPTCHA blocks
 
     Returns:
-        Dict with keys: href, title, body - or None if not found/blocked
+        (status, result) - result is a dict with keys href, title, body when
+        status is FOUND, else None (EMPTY: no profile, BLOCKED: blocked/failed)
 
     Note:
-        - Returns None immediately on 403/CAPTCHA (does not retry)
+        - Returns BLOCKED immediately on 403/CAPTCHA (does not retry)
         - Uses 3-5 second random delays
         - Rotates User-Agent on each request
+        - Results are memoized per (name, company); see _memoized_search
     """
     if not HAS_HTTPX:
-        return None
+        return SearchStatus.BLOCKED, None
 
     if not name or not company:
-        return None
+        return SearchStatus.BLOCKED, None
+
+    return await _memoized_search(
+        ('bing',) + _lead_key(name, company),
+        partial(_fetch_bing, name, company, client, limiter),
+    )
+
+
+async def _read_bing_page(response) -> Tuple[SearchStatus, Optional[Dict]]:
+    """
+    Stream a Bing results page and stop at the first LinkedIn profile.
+
+    The buffer is parsed only once a LinkedIn link has arrived and a later
+    </li> closes its result, so the rest of the page is never downloaded.
+
+    Returns:
+        (status, result) - status is BLOCKED for CAPTCHA pages
+    """
+    buffer = ""
+    scanned = 0
+    # Sticky: a link split across chunks may only parse once a later chunk
+    # completes it, even though that chunk alone doesn't contain the link
+    hit_seen = False
+
+    async for chunk in response.aiter_text():
+        buffer += chunk
+        # Re-check a little overlap so markers split across chunks are seen
+        region = buffer[max(0, scanned - 32):].lower()
+        scanned = len(buffer)
+
+        if any(marker in region for marker in BING_BLOCK_MARKERS):
+            return SearchStatus.BLOCKED, None
+
+        if 'linkedin.com/in/' in region:
+            hit_seen = True
+
+        if hit_seen and '</li>' in region:
+            result = _parse_bing_results(buffer)
+            if result:
+                return SearchStatus.FOUND, result
+
+    # Whole page read; parse any trailing, unclosed hit
+    if hit_seen:
+        result = _parse_bing_results(buffer)
+        if result:
+            return SearchStatus.FOUND, result
+
+    # No valid LinkedIn URLs found
+    return SearchStatus.EMPTY, None
+
+
+async def _fetch_bing(
+    name: str,
+    company: str,
+    client: Optional["httpx.AsyncClient"] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> Tuple[SearchStatus, Optional[Dict]]:
+    """Uncached Bing lookup. Returns (status, result)."""
+    if client is None:
+        async with _new_http_client() as client:
+            return await _fetch_bing(name, company, client, limiter)
 
     # Build search query
     query = f'site:linkedin.com/in "{name}" "{company}"'
 
     # Build URL with query params
-    import urllib.parse
-    params = {
-        'q': query,
-        'count': '10',
-    }
-    url = f"{BING_SEARCH_URL}?{urllib.parse.urlencode(params)}"
+    url = _BING_URL_TEMPLATE.format(q=urllib.parse.quote_plus(query))
 
     # Random delay before request (3-5 seconds)
     delay = random.uniform(BING_MIN_DELAY, BING_MAX_DELAY)
     await asyncio.sleep(delay)
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            headers = _get_bing_headers()
-            response = await client.get(url, headers=headers)
-
+        headers = _get_bing_headers()
+        async with client.stream('GET', url, headers=headers) as response:
             # Handle rate limiting / blocking
             if response.status_code in (403, 429):
                 # Blocked or rate limited - return None, don't retry
-                return None
+                if limiter:
+                    limiter.record_rate_limit()
+                return SearchStatus.BLOCKED, None
 
             if response.status_code != 200:
-                return None
-
-            # Check for CAPTCHA in response
-            if 'captcha' in response.text.lower() or 'unusual traffic' in response.text.lower():
-                return None
-
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Find search results (li.b_algo > h2 a)
-            results = soup.find_all('li', class_='b_algo')
+                return SearchStatus.BLOCKED, None
 
-            for result_elem in results:
-                result = _extract_linkedin_from_bing_result(result_elem)
-                if result:
-                    return result
-
-            # No valid LinkedIn URLs found
-            return None
+            # CAPTCHA check and parse happen while streaming
+            status, result = await _read_bing_page(response)
+            if status is SearchStatus.BLOCKED and limiter:
+                limiter.record_rate_limit()
+            return status, result
 
     except httpx.TimeoutException:
-        return None
+        return SearchStatus.BLOCKED, None
     except httpx.RequestError:
-        return None
+        return SearchStatus.BLOCKED, None
     except Exception:
-        return None
+        return SearchStatus.BLOCKED, None
 
 
 # =============================================================================
@@ -592,17 +1047,29 @@ async def search_bing(name: str, company: str) -> Optional[Dict]:
 DEFAULT_CONFIDENCE = 0.3
 
 
-async def find_linkedin(name: str, company: str, location: str = "") -> LinkedInResult:
+async def find_linkedin(
+    name: str,
+    company: str,
+    location: str = "",
+    client: Optional["httpx.AsyncClient"] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    cache: Optional[LinkedInCache] = None,
+) -> LinkedInResult:
     """
     Find LinkedIn profile for a person using multi-strategy search.
 
-    Primary search uses DuckDuckGo. Falls back to Bing on DDG failure/rate-limit.
-    Never makes direct requests to linkedin.com.
+    Primary search uses DuckDuckGo. Falls back to Bing only when DDG was
+    blocked or failed - a definitive empty DDG answer skips Bing (and its
+    3-5s delay). Never makes direct requests to linkedin.com.
 
     Args:
         name: Person's full name (e.g., "John Smith")
         company: Company name for context (e.g., "Acme Corp")
         location: Optional location hint (currently unused, for future expansion)
+        client: Optional shared httpx.AsyncClient for the Bing fallback
+        limiter: Optional AdaptiveLimiter told about rate limits
+        cache: Optional LinkedInCache checked first and updated afterwards
+               (misses are stored only when no engine was blocked)
 
     Returns:
         LinkedInResult with linkedin_url, owner_name, owner_title, source, confidence
@@ -618,10 +1085,35 @@ async def find_linkedin(name: str, company: str, location: str = "") -> LinkedIn
     if not name or not company:
         return LinkedInResult()
 
+    if cache is not None:
+        cached = cache.get(name, company)
+        if cached is not None:
+            return cached
+
+    result, definitive = await _search_linkedin(name, company, client, limiter)
+
+    if cache is not None and definitive:
+        cache.set(name, company, result)
+
+    return result
+
+
+async def _search_linkedin(
+    name: str,
+    company: str,
+    client: Optional["httpx.AsyncClient"],
+    limiter: Optional[AdaptiveLimiter],
+) -> Tuple[LinkedInResult, bool]:
+    """
+    DDG-then-Bing search behind find_linkedin's persistent cache.
+
+    Returns (result, definitive) - definitive is False when the final
+    answer came from a blocked or failed engine, so a miss is not stored.
+    """
     # Strategy 1: DuckDuckGo (primary - no rate limits, no API key)
-    ddg_result = await search_duckduckgo(name, company)
+    ddg_status, ddg_result = await search_duckduckgo(name, company, limiter=limiter)
 
-    if ddg_result:
+    if ddg_status is SearchStatus.FOUND:
         # Parse snippet for name/title
         parsed = parse_linkedin_snippet(ddg_result.get('title', ''), ddg_result.get('body', ''))
 
@@ -632,12 +1124,16 @@ async def find_linkedin(name: str, company: str, location: str = "") -> LinkedIn
             source='duckduckgo',
             confidence=DEFAULT_CONFIDENCE,
             raw_result=ddg_result,
-        )
+        ), True
+
+    # DDG searched and found nothing - Bing would almost certainly agree
+    if ddg_status is SearchStatus.EMPTY:
+        return LinkedInResult(), True
 
     # Strategy 2: Bing fallback (on DDG failure/rate-limit)
-    bing_result = await search_bing(name, company)
+    bing_status, bing_result = await search_bing(name, company, client=client, limiter=limiter)
 
-    if bing_result:
+    if bing_status is SearchStatus.FOUND:
         # Parse snippet for name/title
         parsed = parse_linkedin_snippet(bing_result.get('title', ''), bing_result.get('body', ''))
 
@@ -648,28 +1144,40 @@ async def find_linkedin(name: str, company: str, location: str = "") -> LinkedIn
             source='bing',
             confidence=DEFAULT_CONFIDENCE,
             raw_result=bing_result,
-        )
+        ), True
 
     # Both strategies failed - return empty result
-    return LinkedInResult()
+    return LinkedInResult(), bing_status is SearchStatus.EMPTY
 
 
 async def find_linkedin_batch(
     leads: List[Dict],
     max_concurrent: int = 5,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    cache: Optional[LinkedInCache] = None,
 ) -> List[Dict]:
     """
     Find LinkedIn profiles for multiple leads with concurrency control.
 
-    Processes leads in parallel within semaphore limit (default 5 concurrent).
-    Uses asyncio.Semaphore to prevent overwhelming search engines.
+    Processes leads with a pool of worker coroutines pulling from a shared
+    queue. An AdaptiveLimiter gates the workers: it backs off when DDG/Bing
+    rate-limit and grows back as lookups succeed. By default the window
+    starts at and never exceeds max_concurrent (default 5); pass a limiter
+    with a higher maximum to let it grow past that. All workers share one
+    pooled httpx.AsyncClient. Duplicate (name, company) leads are searched
+    once and share the result.
+
+    Results are consumed from find_linkedin_batch_iter as they complete, so
+    progress_callback fires as each lead finishes.
 
     Args:
         leads: List of dicts with 'name' and 'company' keys
                Example: [{'name': 'John Smith', 'company': 'Acme Corp'}, ...]
-        max_concurrent: Maximum concurrent searches (default 5, conservative)
+        max_concurrent: Number of worker coroutines (default 5, conservative)
         progress_callback: Optional callback(completed: int, total: int) for progress
+        limiter: Optional AdaptiveLimiter (overrides max_concurrent)
+        cache: Optional LinkedInCache so re-runs skip already-resolved leads
 
     Returns:
         List of dicts with original lead data plus:
@@ -690,41 +1198,124 @@ async def find_linkedin_batch(
     if not leads:
         return []
 
-    semaphore = asyncio.Semaphore(max_concurrent)
-    completed = 0
     total = len(leads)
+    enriched_leads: List[Optional[Dict]] = [None] * total
 
-    async def process_lead(lead: Dict) -> Dict:
-        nonlocal completed
-
-        async with semaphore:
-            name = lead.get('name', '')
-            company = lead.get('company', '')
+    completed = 0
+    async for index, enriched in find_linkedin_batch_iter(
+        leads, max_concurrent=max_concurrent, limiter=limiter, cache=cache,
+    ):
+        enriched_leads[index] = enriched
 
-            result = await find_linkedin(name, company)
+        completed += 1
+        if progress_callback:
+            try:
+                progress_callback(completed, total)
+            except Exception:
+                pass  # Don't let callback errors break processing
 
-            # Merge original lead data with result
-            enriched = lead.copy()
-            enriched['linkedin_url'] = result.linkedin_url
-            enriched['owner_name'] = result.owner_name
-            enriched['owner_title'] = result.owner_title
-            enriched['source'] = result.source
+    # Keep input order; leads whose search raised are dropped
+    return [r for r in enriched_leads if r is not None]
 
-            completed += 1
-            if progress_callback:
-                try:
-                    progress_callback(completed, total)
-                except Exception:
-                    pass  # Don't let callback errors break processing
 
-            return enriched
+async def find_linkedin_batch_iter(
+    leads: List[Dict],
+    max_concurrent: int = 5,
+    limiter: Optional[AdaptiveLimiter] = None,
+    cache: Optional[LinkedInCache] = None,
+) -> AsyncIterator[Tuple[int, Dict]]:
+    """
+    Stream batch results as lookups finish.
 
-    # Process all leads with concurrency control
-    tasks = [process_lead(lead) for lead in leads]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    Same worker pool, limiter, dedupe and cache behaviour as
+    find_linkedin_batch, but yields (index, enriched_lead) in completion
+    order instead of collecting a list. index is the lead's position in
+    leads; leads whose search raised are skipped.
 
-    # Filter out exceptions and return valid results
-    return [r for r in results if isinstance(r, dict)]
+    Example:
+        async for index, lead in find_linkedin_batch_iter(leads):
+            save(lead)
+    """
+    if not leads:
+        return
+
+    # Group duplicate leads so each (name, company) is searched once
+    groups: Dict[Tuple[str, str], List[int]] = {}
+    for index, lead in enumerate(leads):
+        groups.setdefault(_lead_key(lead.get('name'), lead.get('company')), []).append(index)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for indices in groups.values():
+        queue.put_nowait(indices)
+
+    # (indices, LinkedInResult) per finished lookup; None once workers are done
+    finished: asyncio.Queue = asyncio.Queue()
+
+    if limiter is None:
+        limiter = AdaptiveLimiter(initial=max_concurrent, maximum=max_concurrent)
+
+    async def worker(client) -> None:
+        while not queue.empty():
+            await limiter.acquire()
+            try:
+                indices = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                await limiter.release(finished=False)
+                return
+
+            first = leads[indices[0]]
+            try:
+                result = await find_linkedin(
+                    first.get('name', ''), first.get('company', ''),
+                    client=client, limiter=limiter, cache=cache,
+                )
+            except Exception:
+                continue  # Leads whose search raised are dropped
+            finally:
+                await limiter.release()
+
+            finished.put_nowait((indices, result))
+
+    async def run_workers(client) -> None:
+        try:
+            workers = max(1, min(limiter.max, queue.qsize()))
+            await asyncio.gather(*(worker(client) for _ in range(workers)))
+        finally:
+            finished.put_nowait(None)
+
+    async with AsyncExitStack() as stack:
+        # Process unique leads with a bounded worker pool
+        client = await stack.enter_async_context(_new_http_client()) if HAS_HTTPX else None
+        runner = asyncio.create_task(run_workers(client))
+        try:
+            while True:
+                item = await finished.get()
+                if item is None:
+                    break
+
+                indices, result = item
+                for index in indices:
+                    # Merge original lead data with result
+                    enriched = leads[index].copy()
+                    enriched['linkedin_url'] = result.linkedin_url
+                    enriched['owner_name'] = result.owner_name
+                    enriched['owner_title'] = result.owner_title
+                    enriched['source'] = result.source
+                    yield index, enriched
+
+            await runner
+        finally:
+            # Stop workers (consumer left early) and wait for them to unwind
+            # before the exit stack closes the client they are using
+            if not runner.done():
+                runner.cancel()
+                with suppress(asyncio.CancelledError):
+                    await runner
+
+
+# Reused threads for find_linkedin_sync calls made inside a running loop
+_SYNC_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='linkedin-sync')
+atexit.register(_SYNC_POOL.shutdown)
 
 
 def find_linkedin_sync(name: str, company: str, location: str = "") -> LinkedInResult:
@@ -732,7 +1323,8 @@ def find_linkedin_sync(name: str, company: str, location: str = "") -> LinkedInR
     Synchronous wrapper for find_linkedin().
 
     Convenience function for non-async code paths. Creates new event loop
-    if none exists, otherwise uses existing loop.
+    if none exists. Inside a running loop the search runs on a shared
+    worker thread; async callers should await find_linkedin() directly.
 
     Args:
         name: Person's full name
@@ -748,17 +1340,15 @@ def find_linkedin_sync(name: str, company: str, location: str = "") -> LinkedInR
     """
     try:
         # Try to get existing event loop
-        loop = asyncio.get_running_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
         # No running loop - use asyncio.run()
         return asyncio.run(find_linkedin(name, company, location))
 
     # If there's already a running loop, we need to handle differently
     # This is a rare case (usually from Jupyter notebooks or nested async)
-    import concurrent.futures
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        future = pool.submit(asyncio.run, find_linkedin(name, company, location))
-        return future.result()
+    future = _SYNC_POOL.submit(asyncio.run, find_linkedin(name, company, location))
+    return future.result()
 
 
 # =============================================================================
@@ -2,7 +2,8 @@
 Metadata Recon - Stealth Hybrid Lead Engine
 
 Extracts organization info from SSL certificates for business identification.
-Uses Python stdlib only (ssl, socket) - no external dependencies.
+Uses Python stdlib (ssl, socket); the optional `cryptography` package lets
+unverified (self-signed, misconfigured) certificates be decoded too.
 
 Requirements covered:
 - META-01: SSL cert org extraction
@@ -10,10 +11,21 @@ Requirements covered:
 """
 
 import asyncio
+import re
 import ssl
 import socket
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
+
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
 
 
 # =============================================================================
@@ -48,6 +60,129 @@ class MetadataResult:
 # SSL Certificate Extractor (META-01)
 # =============================================================================
 
+# Process-wide SSL contexts keyed by verify flag. create_default_context()
+# loads and parses the system trust store, so build each variant once.
+_ssl_contexts: Dict[bool, ssl.SSLContext] = {}
+_ssl_context_lock = threading.Lock()
+
+
+# cryptography name OIDs -> the attribute names ssl.getpeercert() reports
+_DER_NAME_ATTRS = {
+    NameOID.ORGANIZATION_NAME: 'organizationName',
+    NameOID.ORGANIZATIONAL_UNIT_NAME: 'organizationalUnitName',
+    NameOID.COMMON_NAME: 'commonName',
+    NameOID.LOCALITY_NAME: 'localityName',
+    NameOID.STATE_OR_PROVINCE_NAME: 'stateOrProvinceName',
+    NameOID.COUNTRY_NAME: 'countryName',
+} if HAS_CRYPTOGRAPHY else {}
+
+
+def _decode_der_cert(der: Optional[bytes]) -> dict:
+    """
+    Decode a DER certificate into the getpeercert() dict shape.
+
+    getpeercert() returns {} when verification is off, so the unverified
+    retry would otherwise never see an organization. Needs `cryptography`;
+    returns {} without it.
+    """
+    if not der or not HAS_CRYPTOGRAPHY:
+        return {}
+
+    try:
+        cert = x509.load_der_x509_certificate(der)
+    except ValueError:
+        return {}
+
+    def rdns(name) -> tuple:
+        return tuple(
+            ((_DER_NAME_ATTRS[attr.oid], attr.value),)
+            for attr in name
+            if attr.oid in _DER_NAME_ATTRS
+        )
+
+    return {'subject': rdns(cert.subject), 'issuer': rdns(cert.issuer)}
+
+
+DNS_CACHE_SIZE = 10_000
+DNS_CACHE_TTL = 300  # seconds
+
+# hostname -> (expires_at, [ip, ...]), least recently used first
+_dns_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_dns_cache_lock = threading.Lock()
+
+
+def _cached_addresses(hostname: str) -> Optional[list]:
+    """Return unexpired cached addresses for hostname, or None."""
+    with _dns_cache_lock:
+        entry = _dns_cache.get(hostname)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _dns_cache[hostname]
+            return None
+        _dns_cache.move_to_end(hostname)
+        return entry[1]
+
+
+def _store_addresses(hostname: str, infos: list) -> list:
+    """Cache the distinct addresses from a getaddrinfo() result."""
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    with _dns_cache_lock:
+        _dns_cache[hostname] = (time.monotonic() + DNS_CACHE_TTL, addresses)
+        _dns_cache.move_to_end(hostname)
+        if len(_dns_cache) > DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    return addresses
+
+
+def _resolve(hostname: str) -> list:
+    """Resolve hostname to IP addresses, reusing lookups for DNS_CACHE_TTL."""
+    addresses = _cached_addresses(hostname)
+    if addresses is None:
+        addresses = _store_addresses(
+            hostname,
+            socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+        )
+    return addresses
+
+
+async def _resolve_async(hostname: str) -> list:
+    """Async _resolve: misses go through the loop's resolver, not the caller."""
+    addresses = _cached_addresses(hostname)
+    if addresses is None:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            hostname, None, type=socket.SOCK_STREAM
+        )
+        addresses = _store_addresses(hostname, infos)
+    return addresses
+
+
+def _get_ssl_context(verify_cert: bool) -> ssl.SSLContext:
+    """Return the shared SSL context for verify on/off, building it on first use."""
+    context = _ssl_contexts.get(verify_cert)
+    if context is None:
+        with _ssl_context_lock:
+            context = _ssl_contexts.get(verify_cert)
+            if context is None:
+                context = ssl.create_default_context()
+                if not verify_cert:
+                    context.check_hostname = False
+                    context.verify_mode = ssl.CERT_NONE
+                _ssl_contexts[verify_cert] = context
+    return context
+
+
+# Certificate subject attribute -> CertInfo field
+_SUBJECT_SETTERS = {
+    'organizationName': 'organization',
+    'organizationalUnitName': 'organizational_unit',
+    'commonName': 'common_name',
+    'localityName': 'locality',
+    'stateOrProvinceName': 'state',
+    'countryName': 'country',
+}
+
+
 class SSLCertExtractor:
     """
     Extracts organization info from SSL certificates.
@@ -77,33 +212,20 @@ class SSLCertExtractor:
             CertInfo with extracted data or error
         """
         try:
-            # Create SSL context
-            if self.verify_cert:
-                context = ssl.create_default_context()
-            else:
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
+            context = _get_ssl_context(self.verify_cert)
 
             # Connect and get certificate
-            with socket.create_connection(
-                (hostname, port),
-                timeout=self.timeout
-            ) as sock:
+            with self._connect(hostname, port) as sock:
                 with context.wrap_socket(
                     sock,
                     server_hostname=hostname
                 ) as ssock:
                     cert = ssock.getpeercert()
+                    if not cert:
+                        cert = _decode_der_cert(ssock.getpeercert(binary_form=True))
 
             return self._parse_cert(cert)
 
-        except socket.timeout:
-            return CertInfo(error="timeout")
-        except socket.gaierror as e:
-            return CertInfo(error=f"dns_failure: {e}")
-        except ConnectionRefusedError:
-            return CertInfo(error="connection_refused")
         except ssl.SSLCertVerificationError as e:
             # Try again without verification if it failed
             if self.verify_cert:
@@ -112,12 +234,53 @@ class SSLCertExtractor:
                     verify_cert=False
                 ).extract(hostname, port)
             return CertInfo(error=f"ssl_verification: {e}")
-        except ssl.SSLError as e:
+        except Exception as e:
+            return self._error_info(e)
+
+    def _connect(self, hostname: str, port: int) -> socket.socket:
+        """Open a TCP connection to the first reachable cached address."""
+        error = None
+        for address in _resolve(hostname):
+            try:
+                return socket.create_connection(
+                    (address, port),
+                    timeout=self.timeout
+                )
+            except OSError as e:
+                error = e
+        raise error or socket.gaierror(f"no addresses for {hostname}")
+
+    async def _open_tls(self, hostname: str, port: int):
+        """Async _connect: TLS stream to the first reachable cached address."""
+        error = None
+        for address in await _resolve_async(hostname):
+            try:
+                return await asyncio.open_connection(
+                    address,
+                    port,
+                    ssl=_get_ssl_context(self.verify_cert),
+                    server_hostname=hostname
+                )
+            except ssl.SSLError:
+                raise  # Certificate problems are the same on every address
+            except OSError as e:
+                error = e
+        raise error or socket.gaierror(f"no addresses for {hostname}")
+
+    @staticmethod
+    def _error_info(e: Exception) -> CertInfo:
+        """Map a connection/handshake exception to a CertInfo error."""
+        if isinstance(e, (socket.timeout, asyncio.TimeoutError)):
+            return CertInfo(error="timeout")
+        if isinstance(e, socket.gaierror):
+            return CertInfo(error=f"dns_failure: {e}")
+        if isinstance(e, ConnectionRefusedError):
+            return CertInfo(error="connection_refused")
+        if isinstance(e, ssl.SSLError):
             return CertInfo(error=f"ssl_error: {e}")
-        except OSError as e:
+        if isinstance(e, OSError):
             return CertInfo(error=f"connection_error: {e}")
-        except Exception as e:
-            return CertInfo(error=f"unknown_error: {e}")
+        return CertInfo(error=f"unknown_error: {e}")
 
     def _parse_cert(self, cert: dict) -> CertInfo:
         """Parse certificate dictionary into CertInfo."""
@@ -127,18 +290,9 @@ class SSLCertExtractor:
         if 'subject' in cert:
             for rdn in cert['subject']:
                 for key, value in rdn:
-                    if key == 'organizationName':
-                        info.organization = value
-                    elif key == 'organizationalUnitName':
-                        info.organizational_unit = value
-                    elif key == 'commonName':
-                        info.common_name = value
-                    elif key == 'localityName':
-                        info.locality = value
-                    elif key == 'stateOrProvinceName':
-                        info.state = value
-                    elif key == 'countryName':
-                        info.country = value
+                    attr = _SUBJECT_SETTERS.get(key)
+                    if attr:
+                        setattr(info, attr, value)
 
         # Parse issuer for context (helps determine cert type)
         if 'issuer' in cert:
@@ -155,17 +309,41 @@ class SSLCertExtractor:
 
     async def extract_async(self, hostname: str, port: int = 443) -> CertInfo:
         """
-        Async wrapper for certificate extraction.
+        Async certificate extraction.
 
-        Uses run_in_executor since ssl module is not truly async.
+        Runs the TLS handshake on the event loop via asyncio.open_connection,
+        so batches overlap handshakes without tying up executor threads.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.extract,
-            hostname,
-            port
-        )
+        try:
+            _, writer = await asyncio.wait_for(
+                self._open_tls(hostname, port),
+                timeout=self.timeout
+            )
+            try:
+                cert = writer.get_extra_info('peercert')
+                if not cert:
+                    ssl_object = writer.get_extra_info('ssl_object')
+                    if ssl_object is not None:
+                        cert = _decode_der_cert(ssl_object.getpeercert(binary_form=True))
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except (ssl.SSLError, OSError):
+                    pass  # Peer may drop the connection first
+
+            return self._parse_cert(cert or {})
+
+        except ssl.SSLCertVerificationError as e:
+            # Try again without verification if it failed
+            if self.verify_cert:
+                return await SSLCertExtractor(
+                    timeout=self.timeout,
+                    verify_cert=False
+                ).extract_async(hostname, port)
+            return CertInfo(error=f"ssl_verification: {e}")
+        except Exception as e:
+            return self._error_info(e)
 
 
 # =============================================================================
@@ -173,7 +351,7 @@ class SSLCertExtractor:
 # =============================================================================
 
 # Common placeholder values to filter out
-INVALID_ORG_VALUES = {
+INVALID_ORG_VALUES = frozenset({
     'unknown',
     'none',
     'n/a',
@@ -183,10 +361,10 @@ INVALID_ORG_VALUES = {
     'dv',
     'persona not validated',
     'organization not validated',
-}
+})
 
 # EV cert issuers (partial list of common ones)
-EV_ISSUERS = {
+EV_ISSUERS = frozenset({
     'digicert',
     'comodo',
     'sectigo',
@@ -196,7 +374,10 @@ EV_ISSUERS = {
     'geotrust',
     'thawte',
     'godaddy',
-}
+})
+
+# Matches any known EV issuer inside a lowercased issuer org
+_EV_PATTERN = re.compile('|'.join(map(re.escape, sorted(EV_ISSUERS))))
 
 
 def has_valid_org(cert_info: CertInfo) -> bool:
@@ -211,20 +392,19 @@ def has_valid_org(cert_info: CertInfo) -> bool:
     if not cert_info.organization:
         return False
 
-    org = cert_info.organization.strip()
+    org_lower = cert_info.organization.strip().lower()
 
     # Too short to be meaningful
-    if len(org) < 3:
+    if len(org_lower) < 3:
         return False
 
     # Check against invalid values
-    if org.lower() in INVALID_ORG_VALUES:
+    if org_lower in INVALID_ORG_VALUES:
         return False
 
     # Check if org is just the domain/CN (common in DV certs)
     if cert_info.common_name:
         cn_lower = cert_info.common_name.lower()
-        org_lower = org.lower()
         # If org is same as CN or CN contains org, likely not real org
         if org_lower == cn_lower or org_lower in cn_lower:
             return False
@@ -253,40 +433,60 @@ def org_confidence(cert_info: CertInfo) -> str:
             return "high"
 
     # Check for known EV issuers with EV-specific strings
-    if cert_info.issuer_org:
-        issuer_org_lower = cert_info.issuer_org.lower()
-        for ev_issuer in EV_ISSUERS:
-            if ev_issuer in issuer_org_lower:
-                # Known issuer, likely OV or EV
-                return "medium"
+    if cert_info.issuer_org and _EV_PATTERN.search(cert_info.issuer_org.lower()):
+        # Known issuer, likely OV or EV
+        return "medium"
 
     # Has org but we can't verify cert type
     return "low"
 
 
+# Trailing legal suffixes (", Inc.", " LLC", ...), possibly stacked
+_SUFFIX_RE = re.compile(r'(?:(?:,\s*|\s+)(?:Inc|LLC|Ltd|Corp|Co)\.?)+$')
+
+
 def clean_org_name(org: str) -> str:
     """Clean up organization name for use as identifier."""
     if not org:
         return ""
 
-    # Strip whitespace first
-    cleaned = org.strip()
+    # Strip whitespace first, then remove common suffixes
+    return _SUFFIX_RE.sub('', org.strip()).strip()
 
-    # Remove common suffixes
-    suffixes = [
-        ', Inc.', ', Inc', ' Inc.', ' Inc',
-        ', LLC', ' LLC',
-        ', Ltd.', ', Ltd', ' Ltd.', ' Ltd',
-        ', Corp.', ', Corp', ' Corp.', ' Corp',
-        ', Co.', ', Co', ' Co.', ' Co',
-    ]
 
-    for suffix in suffixes:
-        if cleaned.endswith(suffix):
-            cleaned = cleaned[:-len(suffix)]
-            break  # Only remove one suffix
+# =============================================================================
+# Result Cache
+# =============================================================================
 
-    return cleaned.strip()
+METADATA_CACHE_SIZE = 10_000
+METADATA_CACHE_TTL = 3600  # seconds; certificates rarely change within an hour
+
+# hostname -> (stored_at, MetadataResult), oldest first
+_metadata_cache: "OrderedDict[str, tuple[float, MetadataResult]]" = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+
+def _cache_get(hostname: str) -> Optional[MetadataResult]:
+    """Return a fresh cached result for hostname, or None."""
+    with _metadata_cache_lock:
+        entry = _metadata_cache.get(hostname)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > METADATA_CACHE_TTL:
+            del _metadata_cache[hostname]
+            return None
+        _metadata_cache.move_to_end(hostname)
+        return result
+
+
+def _cache_put(hostname: str, result: MetadataResult) -> None:
+    """Store result, evicting the least recently used entry when full."""
+    with _metadata_cache_lock:
+        _metadata_cache[hostname] = (time.monotonic(), result)
+        _metadata_cache.move_to_end(hostname)
+        if len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
 
 
 # =============================================================================
@@ -297,6 +497,9 @@ async def get_metadata(hostname: str, timeout: int = 10) -> MetadataResult:
     """
     Async API: Get metadata (organization info) for a hostname.
 
+    Successful lookups are cached per hostname for METADATA_CACHE_TTL
+    seconds; errors are not cached so transient failures get retried.
+
     Args:
         hostname: Domain to check (e.g., "example.com")
         timeout: Connection timeout in seconds
@@ -309,6 +512,10 @@ async def get_metadata(hostname: str, timeout: int = 10) -> MetadataResult:
     hostname = hostname.replace("https://", "").replace("http://", "")
     hostname = hostname.split("/")[0]  # Remove path
 
+    cached = _cache_get(hostname)
+    if cached is not None:
+        return cached
+
     extractor = SSLCertExtractor(timeout=timeout)
     cert_info = await extractor.extract_async(hostname)
 
@@ -325,12 +532,14 @@ async def get_metadata(hostname: str, timeout: int = 10) -> MetadataResult:
     if confidence != "none":
         org = clean_org_name(cert_info.organization)
 
-    return MetadataResult(
+    result = MetadataResult(
         hostname=hostname,
         organization=org,
         confidence=confidence,
         cert_info=cert_info
     )
+    _cache_put(hostname, result)
+    return result
 
 
 def get_metadata_sync(hostname: str, timeout: int = 10) -> MetadataResult:
@@ -396,9 +605,13 @@ if __name__ == "__main__":
     print(f"\nExtracting SSL metadata for {len(hostnames)} host(s)...\n")
     print("=" * 70)
 
-    for hostname in hostnames:
-        result = get_metadata_sync(hostname)
+    # One concurrent batch feeds both the per-host output and the summary
+    results = get_metadata_batch_sync(
+        hostnames,
+        max_concurrent=min(32, len(hostnames))
+    )
 
+    for hostname, result in zip(hostnames, results):
         print(f"\n{hostname}")
         print("-" * 40)
 
@@ -419,6 +632,5 @@ if __name__ == "__main__":
     print("\n" + "=" * 70)
 
     # Summary
-    with_org = sum(1 for r in [get_metadata_sync(h) for h in hostnames]
-                   if r.organization)
+    with_org = sum(1 for r in results if r.organization)
     print(f"\nSummary: {with_org}/{len(hostnames)} hosts have organization info")
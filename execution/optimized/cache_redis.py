@@ -29,21 +29,126 @@ Usage:
 
     # Store in cache
     cache.set_decision_maker("example.com", email_data)
+
+    # From async code, use the a-prefixed variants
+    cached = await cache.aget_decision_maker("example.com")
 """
 
 import os
 import json
+import asyncio
 import hashlib
+import weakref
 from typing import Optional, Dict, List
 from datetime import timedelta
+from functools import partial
+
+# orjson (C) on the cache hot path; stdlib json keeps the module usable without it
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps, _loads = json.dumps, json.loads
+
+# DBSIZE + INFO stats in one round-trip
+_STATS_LUA = "return {redis.call('DBSIZE'), redis.call('INFO', 'stats')}"
+
+# Key hashing: xxh3 when available, else 64-bit BLAKE2b (both non-crypto use).
+# The algorithm is part of every key prefix, so processes with and without
+# xxhash sharing one Redis keep visibly separate entries.
+try:
+    import xxhash
+    _HASH_TAG = "xx"
+
+    def _key_hash(identifier: str) -> str:
+        return xxhash.xxh3_64_hexdigest(identifier)
+except ImportError:
+    _HASH_TAG = "b2"
+
+    def _key_hash(identifier: str) -> str:
+        return hashlib.blake2b(identifier.encode(), digest_size=8).hexdigest()
+
+# Cache keys, specialized per kind: prefix fixed, identifier lowercased and
+# hashed so keys are short and fixed-width
+_DM_PREFIX = f"leadsnipe:dm:{_HASH_TAG}:"
+_LI_PREFIX = f"leadsnipe:li:{_HASH_TAG}:"
+
+
+def _dm_key(domain: str) -> str:
+    return _DM_PREFIX + _key_hash(domain.lower())
+
+
+def _li_key(person_key: str) -> str:
+    return _LI_PREFIX + _key_hash(person_key.lower())
+
+
+# Google Maps result lists are stored as msgpack when available: smaller on
+# the wire and decoded in one C call. v2 keys keep old JSON entries apart.
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+if HAS_MSGPACK:
+    GMAPS_PREFIX = "gmaps:v2"
+    _pack_results = partial(msgpack.packb, use_bin_type=True)
+    _unpack_results = partial(msgpack.unpackb, raw=False)
+else:
+    GMAPS_PREFIX = "gmaps"
+    _pack_results, _unpack_results = _dumps, _loads
+
+_GMAPS_KEY_PREFIX = f"leadsnipe:{GMAPS_PREFIX}:{_HASH_TAG}:"
+
+
+def _gmaps_key(query: str) -> str:
+    return _GMAPS_KEY_PREFIX + _key_hash(query.lower())
 
 try:
     import redis
+    import redis.asyncio as aioredis
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     print("⚠️  Redis not installed. Run: pip install redis")
 
+# Connections per client pool; callers beyond this wait (up to 1s) for a
+# free connection instead of opening new sockets
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "32"))
+REDIS_POOL_TIMEOUT = 1.0
+
+
+def _sync_client(redis_url: str, **kwargs) -> "redis.Redis":
+    """Sync client on a bounded, blocking connection pool."""
+    pool = redis.BlockingConnectionPool.from_url(
+        redis_url,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        **kwargs
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+def _async_client(redis_url: str, **kwargs) -> "aioredis.Redis":
+    """Async client on a bounded, blocking connection pool."""
+    pool = aioredis.BlockingConnectionPool.from_url(
+        redis_url,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        **kwargs
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+def _parse_info(info_text: str) -> Dict[str, int]:
+    """Parse the integer fields of a raw INFO reply ("name:value" lines)."""
+    info = {}
+    for line in info_text.splitlines():
+        name, sep, value = line.partition(":")
+        if sep and value.isdigit():
+            info[name] = int(value)
+    return info
+
 
 class LeadCache:
     """
@@ -61,6 +166,14 @@ class LeadCache:
         """
         self.enabled = REDIS_AVAILABLE
         self.redis = None
+        self.redis_url = None
+        self.gmaps_redis = None
+        self._stats_script = None
+
+        # Event loop → {decode_responses: async client}. Async clients are
+        # bound to the loop that first uses them, so each loop gets its own;
+        # entries vanish with their loop.
+        self._async_clients = weakref.WeakKeyDictionary()
 
         if not REDIS_AVAILABLE:
             return
@@ -68,13 +181,23 @@ class LeadCache:
         try:
             # Get Redis URL from env or use localhost
             redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+            self.redis_url = redis_url
 
             # Connect to Redis
-            self.redis = redis.from_url(redis_url, decode_responses=True)
+            self.redis = _sync_client(redis_url, decode_responses=True)
 
             # Test connection
             self.redis.ping()
 
+            # Script object runs EVALSHA, loading the script on first NOSCRIPT
+            self._stats_script = self.redis.register_script(_STATS_LUA)
+
+            # msgpack blobs need clients that return raw bytes
+            if HAS_MSGPACK:
+                self.gmaps_redis = _sync_client(redis_url)
+            else:
+                self.gmaps_redis = self.redis
+
             print("✅ Redis cache connected")
 
         except Exception as e:
@@ -82,12 +205,29 @@ class LeadCache:
             print("   Continuing without cache...")
             self.enabled = False
 
-    def _make_key(self, prefix: str, identifier: str) -> str:
-        """Generate cache key."""
-        # Hash long identifiers to keep keys short
-        if len(identifier) > 50:
-            identifier = hashlib.md5(identifier.encode()).hexdigest()
-        return f"leadsnipe:{prefix}:{identifier}"
+    def _async_redis(self, decode_responses: bool = True) -> "aioredis.Redis":
+        """Return the running loop's async client, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.get(loop)
+        if clients is None:
+            clients = self._async_clients[loop] = {}
+        client = clients.get(decode_responses)
+        if client is None:
+            client = clients[decode_responses] = _async_client(
+                self.redis_url,
+                decode_responses=decode_responses
+            )
+        return client
+
+    @property
+    def aredis(self) -> "aioredis.Redis":
+        """Async client (str replies) for the running event loop."""
+        return self._async_redis()
+
+    @property
+    def gmaps_aredis(self) -> "aioredis.Redis":
+        """Async client for Google Maps blobs (bytes replies under msgpack)."""
+        return self._async_redis(decode_responses=not HAS_MSGPACK)
 
     # ========================================================================
     # Decision Maker Email Cache
@@ -107,11 +247,11 @@ class LeadCache:
             return None
 
         try:
-            key = self._make_key("dm", domain.lower())
+            key = _dm_key(domain)
             data = self.redis.get(key)
 
             if data:
-                return json.loads(data)
+                return _loads(data)
 
         except Exception as e:
             print(f"   ⚠️  Cache read error: {e}")
@@ -131,11 +271,11 @@ class LeadCache:
             return
 
         try:
-            key = self._make_key("dm", domain.lower())
+            key = _dm_key(domain)
             self.redis.setex(
                 key,
                 timedelta(days=ttl_days),
-                json.dumps(data)
+                _dumps(data)
             )
         except Exception as e:
             print(f"   ⚠️  Cache write error: {e}")
@@ -158,7 +298,7 @@ class LeadCache:
             return None
 
         try:
-            key = self._make_key("li", person_key.lower())
+            key = _li_key(person_key)
             return self.redis.get(key)
         except Exception as e:
             print(f"   ⚠️  Cache read error: {e}")
@@ -177,7 +317,7 @@ class LeadCache:
             return
 
         try:
-            key = self._make_key("li", person_key.lower())
+            key = _li_key(person_key)
             self.redis.setex(
                 key,
                 timedelta(days=ttl_days),
@@ -204,11 +344,11 @@ class LeadCache:
             return None
 
         try:
-            key = self._make_key("gmaps", query.lower())
-            data = self.redis.get(key)
+            key = _gmaps_key(query)
+            data = self.gmaps_redis.get(key)
 
             if data:
-                return json.loads(data)
+                return _unpack_results(data)
         except Exception as e:
             print(f"   ⚠️  Cache read error: {e}")
 
@@ -227,11 +367,11 @@ class LeadCache:
             return
 
         try:
-            key = self._make_key("gmaps", query.lower())
-            self.redis.setex(
+            key = _gmaps_key(query)
+            self.gmaps_redis.setex(
                 key,
                 timedelta(days=ttl_days),
-                json.dumps(results)
+                _pack_results(results)
             )
         except Exception as e:
             print(f"   ⚠️  Cache write error: {e}")
@@ -255,19 +395,16 @@ class LeadCache:
 
         try:
             # Build keys
-            keys = [self._make_key("dm", d.lower()) for d in domains]
+            keys = [_dm_key(d) for d in domains]
 
-            # Batch get
-            pipeline = self.redis.pipeline()
-            for key in keys:
-                pipeline.get(key)
-            results = pipeline.execute()
+            # Batch get (one MGET command)
+            results = self.redis.mget(keys) if keys else []
 
             # Parse results
             cached = {}
             for domain, data in zip(domains, results):
                 if data:
-                    cached[domain] = json.loads(data)
+                    cached[domain] = _loads(data)
 
             return cached
 
@@ -275,6 +412,226 @@ class LeadCache:
             print(f"   ⚠️  Batch cache read error: {e}")
             return {}
 
+    def set_many_decision_makers(self, items: Dict[str, Dict], ttl_days: int = 30):
+        """
+        Cache multiple decision makers in one round-trip.
+
+        Args:
+            items: Dict mapping domain → decision maker data
+            ttl_days: Cache TTL in days (default: 30)
+        """
+        if not self.enabled or not items:
+            return
+
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for domain, data in items.items():
+                pipeline.setex(
+                    _dm_key(domain),
+                    timedelta(days=ttl_days),
+                    _dumps(data)
+                )
+            pipeline.execute()
+        except Exception as e:
+            print(f"   ⚠️  Batch cache write error: {e}")
+
+    def set_many_linkedin(self, items: Dict[str, str], ttl_days: int = 90):
+        """
+        Cache multiple LinkedIn URLs in one round-trip.
+
+        Args:
+            items: Dict mapping person_key → LinkedIn URL
+            ttl_days: Cache TTL in days (default: 90)
+        """
+        if not self.enabled or not items:
+            return
+
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for person_key, linkedin_url in items.items():
+                pipeline.setex(
+                    _li_key(person_key),
+                    timedelta(days=ttl_days),
+                    linkedin_url
+                )
+            pipeline.execute()
+        except Exception as e:
+            print(f"   ⚠️  Batch cache write error: {e}")
+
+    # ========================================================================
+    # Async API (for callers running on an event loop)
+    # ========================================================================
+
+    async def aget_decision_maker(self, domain: str) -> Optional[Dict]:
+        """Async get_decision_maker."""
+        if not self.enabled:
+            return None
+
+        try:
+            key = _dm_key(domain)
+            data = await self.aredis.get(key)
+
+            if data:
+                return _loads(data)
+
+        except Exception as e:
+            print(f"   ⚠️  Cache read error: {e}")
+
+        return None
+
+    async def aset_decision_maker(self, domain: str, data: Dict, ttl_days: int = 30):
+        """Async set_decision_maker."""
+        if not self.enabled:
+            return
+
+        try:
+            key = _dm_key(domain)
+            await self.aredis.setex(
+                key,
+                timedelta(days=ttl_days),
+                _dumps(data)
+            )
+        except Exception as e:
+            print(f"   ⚠️  Cache write error: {e}")
+
+    async def aget_linkedin(self, person_key: str) -> Optional[str]:
+        """Async get_linkedin."""
+        if not self.enabled:
+            return None
+
+        try:
+            key = _li_key(person_key)
+            return await self.aredis.get(key)
+        except Exception as e:
+            print(f"   ⚠️  Cache read error: {e}")
+            return None
+
+    async def aset_linkedin(self, person_key: str, linkedin_url: str, ttl_days: int = 90):
+        """Async set_linkedin."""
+        if not self.enabled:
+            return
+
+        try:
+            key = _li_key(person_key)
+            await self.aredis.setex(
+                key,
+                timedelta(days=ttl_days),
+                linkedin_url
+            )
+        except Exception as e:
+            print(f"   ⚠️  Cache write error: {e}")
+
+    async def aget_gmaps_results(self, query: str) -> Optional[List[Dict]]:
+        """Async get_gmaps_results."""
+        if not self.enabled:
+            return None
+
+        try:
+            key = _gmaps_key(query)
+            data = await self.gmaps_aredis.get(key)
+
+            if data:
+                return _unpack_results(data)
+        except Exception as e:
+            print(f"   ⚠️  Cache read error: {e}")
+
+        return None
+
+    async def aset_gmaps_results(self, query: str, results: List[Dict], ttl_days: int = 7):
+        """Async set_gmaps_results."""
+        if not self.enabled:
+            return
+
+        try:
+            key = _gmaps_key(query)
+            await self.gmaps_aredis.setex(
+                key,
+                timedelta(days=ttl_days),
+                _pack_results(results)
+            )
+        except Exception as e:
+            print(f"   ⚠️  Cache write error: {e}")
+
+    async def aget_many_linkedin(self, person_keys: List[str]) -> Dict[str, str]:
+        """
+        Get multiple LinkedIn URLs in one round-trip.
+
+        Args:
+            person_keys: List of person identifiers
+
+        Returns:
+            Dict mapping person_key → LinkedIn URL (hits only)
+        """
+        if not self.enabled or not person_keys:
+            return {}
+
+        try:
+            results = await self.aredis.mget([
+                _li_key(person_key)
+                for person_key in person_keys
+            ])
+
+            return {
+                person_key: url
+                for person_key, url in zip(person_keys, results)
+                if url
+            }
+
+        except Exception as e:
+            print(f"   ⚠️  Batch cache read error: {e}")
+            return {}
+
+    async def aset_many_decision_makers(self, items: Dict[str, Dict], ttl_days: int = 30):
+        """Async set_many_decision_makers."""
+        if not self.enabled or not items:
+            return
+
+        try:
+            async with self.aredis.pipeline(transaction=False) as pipeline:
+                for domain, data in items.items():
+                    pipeline.setex(
+                        _dm_key(domain),
+                        timedelta(days=ttl_days),
+                        _dumps(data)
+                    )
+                await pipeline.execute()
+        except Exception as e:
+            print(f"   ⚠️  Batch cache write error: {e}")
+
+    async def aset_many_linkedin(self, items: Dict[str, str], ttl_days: int = 90):
+        """Async set_many_linkedin."""
+        if not self.enabled or not items:
+            return
+
+        try:
+            async with self.aredis.pipeline(transaction=False) as pipeline:
+                for person_key, linkedin_url in items.items():
+                    pipeline.setex(
+                        _li_key(person_key),
+                        timedelta(days=ttl_days),
+                        linkedin_url
+                    )
+                await pipeline.execute()
+        except Exception as e:
+            print(f"   ⚠️  Batch cache write error: {e}")
+
+    async def aclose(self):
+        """
+        Disconnect the running loop's async clients.
+
+        Call before the loop ends; the next async call on this loop opens
+        fresh connections.
+        """
+        clients = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if not clients:
+            return
+
+        for client in clients.values():
+            try:
+                await client.connection_pool.disconnect()
+            except Exception as e:
+                print(f"   ⚠️  Cache disconnect error: {e}")
+
     # ========================================================================
     # Stats & Utilities
     # ========================================================================
@@ -285,11 +642,12 @@ class LeadCache:
             return {"enabled": False}
 
         try:
-            info = self.redis.info("stats")
+            keys, info_text = self._stats_script()
+            info = _parse_info(info_text)
 
             return {
                 "enabled": True,
-                "keys": self.redis.dbsize(),
+                "keys": keys,
                 "hits": info.get("keyspace_hits", 0),
                 "misses": info.get("keyspace_misses", 0),
                 "hit_rate": info.get("keyspace_hits", 0) / max(
@@ -300,16 +658,30 @@ class LeadCache:
             print(f"   ⚠️  Stats error: {e}")
             return {"enabled": True, "error": str(e)}
 
+    def _scan_batches(self, pattern: str, count: int = 500):
+        """Yield non-empty lists of keys matching pattern, one SCAN page at a time."""
+        cursor = 0
+        while True:
+            cursor, keys = self.redis.scan(cursor=cursor, match=pattern, count=count)
+            if keys:
+                yield keys
+            if cursor == 0:
+                break
+
     def clear_all(self):
         """Clear all LeadSnipe cache keys."""
         if not self.enabled:
             return
 
         try:
-            keys = self.redis.keys("leadsnipe:*")
-            if keys:
-                self.redis.delete(*keys)
-                print(f"🗑️  Cleared {len(keys)} cache keys")
+            # SCAN in chunks instead of a blocking KEYS; UNLINK frees memory
+            # off the server's main thread
+            cleared = 0
+            for keys in self._scan_batches("leadsnipe:*"):
+                self.redis.unlink(*keys)
+                cleared += len(keys)
+            if cleared:
+                print(f"🗑️  Cleared {cleared} cache keys")
         except Exception as e:
             print(f"   ⚠️  Clear error: {e}")
 
@@ -9,6 +9,7 @@ Multi-source LinkedIn discovery using:
 
 Usage:
     pip install ddgs aiohttp
+    pip install uvloop  # optional, faster event loop on Linux/macOS
 
     python3 execution/find_linkedin_smart_async.py \
       --input .tmp/leads_with_owners.json \
@@ -25,9 +26,53 @@ import json
 import argparse
 import asyncio
 import re
+import threading
 from typing import Optional, Dict, List
+import orjson
 from ddgs import DDGS
 from datetime import datetime
+from cache_redis import LeadCache, get_cache
+
+# google-re2 scans in linear time (DFA, no backtracking); used for the
+# large scraped_text blobs when installed
+try:
+    import re2 as re_fast
+except ImportError:
+    re_fast = re
+
+# LinkedIn profile URLs: linkedin.com/in/username or www.linkedin.com/in/username
+_LI_HREF_RE = re_fast.compile(r'(?i)https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9-]+')
+_LI_VALIDATE_RE = re.compile(r'^https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9-]+/?$')
+
+# Last two address parts: "123 Main St, Newark, NJ 07102" → ("Newark", "NJ")
+_ADDR_RE = re.compile(r'([^,]*),\s*([^,\s]+)[^,]*$')
+
+# Restricts DuckDuckGo strategies to profile pages
+_DDG_SITE = 'site:linkedin.com/in'
+
+# Cached value for DuckDuckGo queries that returned no profile
+DDG_MISS = "__MISS__"
+
+# Seconds a strategy's request may run (after its delay) before the next
+# strategy is started alongside it
+STRATEGY_HEDGE_DELAY = 3.0
+
+# DuckDuckGo requests already sent; they finish (and cache their answer) even
+# when the strategy that started them is cancelled
+_sent_lookups: set = set()
+
+# One DDGS session per executor thread, so keep-alive connections are
+# reused across searches (DDGS is not safe to share between threads)
+_ddg_local = threading.local()
+
+
+def _get_ddgs() -> DDGS:
+    """Return the calling thread's DDGS instance, creating it on first use."""
+    ddgs = getattr(_ddg_local, 'ddgs', None)
+    if ddgs is None:
+        ddgs = _ddg_local.ddgs = DDGS()
+    return ddgs
+
 
 def extract_linkedin_from_html(scraped_text: str) -> Optional[str]:
     """
@@ -42,15 +87,12 @@ def extract_linkedin_from_html(scraped_text: str) -> Optional[str]:
     if not scraped_text:
         return None
 
-    # Pattern for LinkedIn profile URLs
-    # Matches: linkedin.com/in/username or www.linkedin.com/in/username
-    pattern = r'https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9-]+'
+    # One case-insensitive scan that stops at the first profile link
+    match = _LI_HREF_RE.search(scraped_text)
 
-    matches = re.findall(pattern, scraped_text, re.IGNORECASE)
-
-    if matches:
+    if match:
         # Return first profile found, clean it up
-        url = matches[0]
+        url = match.group(0)
         # Ensure it's not a company page
         if '/company/' not in url:
             return url
@@ -79,36 +121,32 @@ def validate_linkedin_url(url: str) -> bool:
     if not url:
         return False
 
-    pattern = r'^https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9-]+/?$'
-    return bool(re.match(pattern, url))
+    return bool(_LI_VALIDATE_RE.match(url))
 
 
-def extract_linkedin_from_search_results(search_results: List) -> Optional[str]:
+def extract_linkedin_from_search_results(search_results: List[tuple]) -> Optional[str]:
     """
     Extract LinkedIn profile URL from DuckDuckGo search results.
 
+    Result links are checked first; result bodies are only scanned when no
+    link is a profile.
+
     Args:
-        search_results: List of search result dictionaries
+        search_results: (url, body) pairs, one per search result
 
     Returns:
         First valid LinkedIn profile URL found or None
     """
-    for result in search_results:
-        # Check href/link
-        url = result.get('href') or result.get('link') or ''
-
+    # Check href/link
+    for url, _ in search_results:
         if 'linkedin.com/in/' in url and '/company/' not in url:
             # Clean and validate
             if validate_linkedin_url(url):
                 return url
 
-        # Check body text for URLs
-        body = result.get('body', '')
-        linkedin_match = re.search(
-            r'https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9-]+',
-            body,
-            re.IGNORECASE
-        )
+    # Check body text for URLs
+    for _, body in search_results:
+        linkedin_match = _LI_HREF_RE.search(body)
         if linkedin_match:
             url = linkedin_match.group(0)
             if validate_linkedin_url(url):
@@ -120,7 +158,8 @@ def extract_linkedin_from_search_results(search_results: List) -> Optional[str]:
 async def search_linkedin_duckduckgo(
     query: str,
     max_results: int = 3,
-    delay: float = 0.5
+    delay: float = 0.5,
+    cache: Optional[LeadCache] = None
 ) -> Optional[str]:
     """
     Search for LinkedIn profile using DuckDuckGo (async).
@@ -129,23 +168,52 @@ async def search_linkedin_duckduckgo(
         query: Search query
         max_results: Number of results to fetch
         delay: Delay before search (seconds)
+        cache: LeadCache memoizing query → URL (misses included, 7 days)
 
     Returns:
         LinkedIn profile URL or None
     """
-    try:
-        # Small delay to avoid rate limiting
-        await asyncio.sleep(delay)
+    cache_key = f"ddg:{query}"
+    if cache:
+        cached = await cache.aget_linkedin(cache_key)
+        if cached is not None:
+            return None if cached == DDG_MISS else cached
 
+    # Small delay to avoid rate limiting (cancelling here spends no request)
+    await asyncio.sleep(delay)
+
+    # Shielded: a cancelled caller stops waiting, but the sent request still
+    # completes and its answer is cached
+    lookup = asyncio.create_task(_ddg_lookup(query, max_results, cache_key, cache))
+    _sent_lookups.add(lookup)
+    lookup.add_done_callback(_sent_lookups.discard)
+    return await asyncio.shield(lookup)
+
+
+async def _ddg_lookup(
+    query: str,
+    max_results: int,
+    cache_key: str,
+    cache: Optional[LeadCache]
+) -> Optional[str]:
+    """Run one DuckDuckGo query and cache the answer (misses included)."""
+    try:
         # Search DuckDuckGo (note: ddgs library is sync, so we run in executor)
         loop = asyncio.get_event_loop()
         results = await loop.run_in_executor(
             None,
-            lambda: list(DDGS().text(query, max_results=max_results))
+            lambda: list(_get_ddgs().text(query, max_results=max_results))
         )
 
-        # Extract LinkedIn URL from results
-        linkedin_url = extract_linkedin_from_search_results(results)
+        # Normalize once into (url, body) pairs, then extract the LinkedIn URL
+        pairs = [
+            (r.get('href') or r.get('link') or '', r.get('body') or '')
+            for r in results
+        ]
+        linkedin_url = extract_linkedin_from_search_results(pairs)
+
+        if cache:
+            await cache.aset_linkedin(cache_key, linkedin_url or DDG_MISS, ttl_days=7)
 
         return linkedin_url
 
@@ -157,7 +225,8 @@ async def search_linkedin_duckduckgo(
 async def find_linkedin_multi_strategy(
     lead: Dict,
     delay: float = 0.5,
-    max_strategies: int = 2
+    max_strategies: int = 2,
+    cache: Optional[LeadCache] = None
 ) -> Dict:
     """
     Find LinkedIn profile using multiple strategies (async).
@@ -172,6 +241,7 @@ async def find_linkedin_multi_strategy(
         lead: Lead dictionary with decision_maker field
         delay: Delay between DuckDuckGo searches
         max_strategies: Maximum number of DuckDuckGo strategies to try
+        cache: Optional LeadCache for memoizing DuckDuckGo queries
 
     Returns:
         Dict with linkedin_url and linkedin_source
@@ -191,9 +261,9 @@ async def find_linkedin_multi_strategy(
     city = ''
     if address:
         # "123 Main St, Newark, NJ 07102" → "Newark, NJ"
-        parts = address.split(',')
-        if len(parts) >= 2:
-            city = f"{parts[-2].strip()}, {parts[-1].split()[0].strip()}"
+        match = _ADDR_RE.search(address)
+        if match:
+            city = f"{match.group(1).strip()}, {match.group(2)}"
 
     # STRATEGY 1: Check Anymailfinder response
     if anymailfinder_linkedin and validate_linkedin_url(anymailfinder_linkedin):
@@ -222,29 +292,50 @@ async def find_linkedin_multi_strategy(
 
     # STRATEGY 3: DuckDuckGo - Full name + Job title + Company
     if full_name and job_title and business_name and max_strategies >= 1:
-        query = f'site:linkedin.com/in "{full_name}" "{job_title}" "{business_name}"'
+        query = f'{_DDG_SITE} "{full_name}" "{job_title}" "{business_name}"'
         search_tasks.append(('strategy_1', query))
 
     # STRATEGY 4: DuckDuckGo - Full name + Company + Location
     if full_name and business_name and city and max_strategies >= 2:
-        query = f'site:linkedin.com/in "{full_name}" "{business_name}" "{city}"'
+        query = f'{_DDG_SITE} "{full_name}" "{business_name}" "{city}"'
         search_tasks.append(('strategy_2', query))
 
-    # Execute searches in parallel
+    # Execute searches, hedged: each strategy starts once the previous one
+    # missed, or alongside it if that one is still running after the hedge delay
     if search_tasks:
-        print(f"      🔍 Trying {len(search_tasks)} strategies in parallel...", end="", flush=True)
-
-        tasks = [search_linkedin_duckduckgo(query, delay=delay) for _, query in search_tasks]
-        results = await asyncio.gather(*tasks)
-
-        # Check if any strategy found a result
-        for (strategy_name, _), result in zip(search_tasks, results):
-            if result:
-                print(f" ✅ {strategy_name}")
-                return {
-                    "linkedin_url": result,
-                    "linkedin_source": f"duckduckgo_{strategy_name}"
-                }
+        print(f"      🔍 Trying {len(search_tasks)} strategies...", end="", flush=True)
+
+        async def run_strategy(strategy_name: str, query: str):
+            return strategy_name, await search_linkedin_duckduckgo(query, delay=delay, cache=cache)
+
+        remaining = iter(search_tasks)
+        next_search = next(remaining, None)
+        pending = set()
+
+        # First strategy to find a profile wins; the rest are cancelled, so
+        # any still waiting out their delay never send a request
+        try:
+            while next_search or pending:
+                if next_search:
+                    pending.add(asyncio.create_task(run_strategy(*next_search)))
+                    next_search = next(remaining, None)
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay + STRATEGY_HEDGE_DELAY if next_search else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    strategy_name, result = task.result()
+                    if result:
+                        print(f" ✅ {strategy_name}")
+                        return {
+                            "linkedin_url": result,
+                            "linkedin_source": f"duckduckgo_{strategy_name}"
+                        }
+        finally:
+            for task in pending:
+                task.cancel()
 
         print(" ❌")
 
@@ -255,7 +346,12 @@ async def find_linkedin_multi_strategy(
     }
 
 
-async def find_linkedin_for_single_lead(lead: Dict, delay: float = 0.5, max_strategies: int = 2) -> Dict:
+async def find_linkedin_for_single_lead(
+    lead: Dict,
+    delay: float = 0.5,
+    max_strategies: int = 2,
+    cache: Optional[LeadCache] = None
+) -> Dict:
     """
     Find LinkedIn profile for a single lead (async).
 
@@ -263,6 +359,7 @@ async def find_linkedin_for_single_lead(lead: Dict, delay: float = 0.5, max_stra
         lead: Lead dictionary
         delay: Delay between searches
         max_strategies: Max DuckDuckGo strategies
+        cache: Optional LeadCache for memoizing DuckDuckGo queries
 
     Returns:
         Lead with linkedin_url and linkedin_source added to decision_maker
@@ -287,7 +384,7 @@ async def find_linkedin_for_single_lead(lead: Dict, delay: float = 0.5, max_stra
 
     # Try DuckDuckGo
     if decision_maker.get('full_name') or decision_maker.get('email'):
-        result = await find_linkedin_multi_strategy(lead, delay, max_strategies)
+        result = await find_linkedin_multi_strategy(lead, delay, max_strategies, cache)
         lead['decision_maker']['linkedin_url'] = result['linkedin_url']
         lead['decision_maker']['linkedin_source'] = result['linkedin_source']
     else:
@@ -297,11 +394,20 @@ async def find_linkedin_for_single_lead(lead: Dict, delay: float = 0.5, max_stra
     return lead
 
 
+def _person_key(lead: Dict) -> Optional[str]:
+    """Cache key for a lead's decision maker ("Full Name|Business"), or None."""
+    full_name = lead.get('decision_maker', {}).get('full_name')
+    if not full_name:
+        return None
+    return f"{full_name}|{lead.get('name', '')}"
+
+
 async def find_linkedin_for_leads(
     leads: List[Dict],
     delay: float = 0.5,
     max_strategies: int = 2,
-    max_concurrent: int = 5
+    max_concurrent: int = 5,
+    use_cache: bool = True
 ) -> List[Dict]:
     """
     Find LinkedIn profiles for all leads (async parallel).
@@ -311,6 +417,7 @@ async def find_linkedin_for_leads(
         delay: Delay between DuckDuckGo searches
         max_strategies: Max number of DuckDuckGo strategies per lead
         max_concurrent: Maximum concurrent lead processing
+        use_cache: Whether to use the Redis LinkedIn cache
 
     Returns:
         List of leads with linkedin_url and linkedin_source added
@@ -320,9 +427,14 @@ async def find_linkedin_for_leads(
         "anymailfinder": 0,
         "website_html": 0,
         "duckduckgo": 0,
+        "cache": 0,
         "not_found": 0
     }
 
+    cache = get_cache() if use_cache else None
+    if cache and not cache.enabled:
+        cache = None
+
     print(f"\n{'='*70}")
     print(f"🔍 FINDING LINKEDIN PROFILES (ASYNC)")
     print(f"{'='*70}")
@@ -331,48 +443,84 @@ async def find_linkedin_for_leads(
     print(f"DuckDuckGo delay: {delay}s between searches")
     print()
 
-    enriched_leads = []
-
-    # Process leads in batches to control concurrency
-    for i in range(0, len(leads), max_concurrent):
-        batch = leads[i:i+max_concurrent]
-
-        # Create tasks for this batch
-        tasks = [
-            find_linkedin_for_single_lead(lead, delay, max_strategies)
-            for lead in batch
-        ]
+    def record(lead: Dict, index: int):
+        """Update stats and print progress for a finished lead."""
+        business_name = lead.get('name', 'Unknown')
+        decision_maker = lead.get('decision_maker', {})
+        full_name = decision_maker.get('full_name') or 'Unknown'
+
+        linkedin_source = decision_maker.get('linkedin_source')
+
+        if linkedin_source == 'anymailfinder':
+            stats['anymailfinder'] += 1
+            print(f"[{index}/{len(leads)}] {full_name} ({business_name}) ✅ anymailfinder")
+        elif linkedin_source == 'website_html':
+            stats['website_html'] += 1
+            print(f"[{index}/{len(leads)}] {full_name} ({business_name}) ✅ website_html")
+        elif linkedin_source and 'duckduckgo' in linkedin_source:
+            stats['duckduckgo'] += 1
+            print(f"[{index}/{len(leads)}] {full_name} ({business_name}) ✅ {linkedin_source}")
+        elif linkedin_source == 'cache':
+            stats['cache'] += 1
+            print(f"[{index}/{len(leads)}] {full_name} ({business_name}) ✅ cache")
+        else:
+            stats['not_found'] += 1
+            print(f"[{index}/{len(leads)}] {full_name} ({business_name}) ❌ Not found")
 
-        # Execute batch in parallel
-        batch_results = await asyncio.gather(*tasks)
-
-        # Update stats and collect results
-        for j, lead in enumerate(batch_results, 1):
-            global_index = i + j
-            business_name = lead.get('name', 'Unknown')
-            decision_maker = lead.get('decision_maker', {})
-            full_name = decision_maker.get('full_name') or 'Unknown'
-
-            linkedin_url = decision_maker.get('linkedin_url')
-            linkedin_source = decision_maker.get('linkedin_source')
-
-            if linkedin_source == 'anymailfinder':
-                stats['anymailfinder'] += 1
-                print(f"[{global_index}/{len(leads)}] {full_name} ({business_name}) ✅ anymailfinder")
-            elif linkedin_source == 'website_html':
-                stats['website_html'] += 1
-                print(f"[{global_index}/{len(leads)}] {full_name} ({business_name}) ✅ website_html")
-            elif linkedin_source and 'duckduckgo' in linkedin_source:
-                stats['duckduckgo'] += 1
-                print(f"[{global_index}/{len(leads)}] {full_name} ({business_name}) ✅ {linkedin_source}")
+    try:
+        # Person keys are built once per lead; every lead still needing a
+        # search is checked against the cache in one MGET up front
+        person_keys = [_person_key(lead) for lead in leads]
+        cached = {}
+        if cache:
+            cached = await cache.aget_many_linkedin([
+                key for lead, key in zip(leads, person_keys)
+                if key and not lead['decision_maker'].get('linkedin_url')
+            ])
+
+        # A semaphore (not fixed batches) caps concurrency, so each finished
+        # lead immediately frees a slot for the next one
+        semaphore = asyncio.Semaphore(max_concurrent)
+        completed = 0
+
+        async def run(lead: Dict, person_key: Optional[str]) -> Dict:
+            nonlocal completed
+            url = cached.get(person_key)
+            if url:
+                # Cache hits skip discovery
+                lead['decision_maker']['linkedin_url'] = url
+                lead['decision_maker']['linkedin_source'] = 'cache'
             else:
-                stats['not_found'] += 1
-                print(f"[{global_index}/{len(leads)}] {full_name} ({business_name}) ❌ Not found")
-
-            enriched_leads.append(lead)
+                async with semaphore:
+                    await find_linkedin_for_single_lead(lead, delay, max_strategies, cache)
+
+            completed += 1
+            record(lead, completed)
+            return lead
+
+        enriched_leads = await asyncio.gather(*(
+            run(lead, key) for lead, key in zip(leads, person_keys)
+        ))
+
+        # Remember DuckDuckGo finds for the next run, one pipelined write
+        if cache:
+            await cache.aset_many_linkedin({
+                key: lead['decision_maker']['linkedin_url']
+                for lead, key in zip(enriched_leads, person_keys)
+                if key and (lead['decision_maker'].get('linkedin_source') or '').startswith('duckduckgo')
+            })
+    finally:
+        # Async Redis clients are per event loop; release this loop's sockets
+        # once requests orphaned by a winning strategy have cached their answer
+        if cache:
+            loop = asyncio.get_running_loop()
+            sent = [task for task in _sent_lookups if task.get_loop() is loop]
+            if sent:
+                await asyncio.gather(*sent, return_exceptions=True)
+            await cache.aclose()
 
     # Summary
-    total_found = stats['anymailfinder'] + stats['website_html'] + stats['duckduckgo']
+    total_found = stats['anymailfinder'] + stats['website_html'] + stats['duckduckgo'] + stats['cache']
 
     print(f"\n{'='*70}")
     print(f"✅ LINKEDIN DISCOVERY COMPLETE")
@@ -382,11 +530,12 @@ async def find_linkedin_for_leads(
     print(f"   - Anymailfinder: {stats['anymailfinder']}")
     print(f"   - Website HTML: {stats['website_html']}")
     print(f"   - DuckDuckGo: {stats['duckduckgo']}")
+    print(f"   - Cache: {stats['cache']}")
     print(f"❌ Not found: {stats['not_found']}")
     print(f"💰 Cost: $0.00 (FREE)")
     print()
 
-    return enriched_leads
+    return list(enriched_leads)
 
 
 def main():
@@ -421,13 +570,15 @@ def main():
         default=5,
         help='Maximum concurrent lead processing (default: 5)'
     )
+    parser.add_argument('--no-cache', action='store_true', help='Disable cache')
+    parser.add_argument('--pretty', action='store_true', help='Indent the output JSON')
 
     args = parser.parse_args()
 
     # Load leads
     try:
-        with open(args.input, 'r') as f:
-            leads = json.load(f)
+        with open(args.input, 'rb') as f:
+            leads = orjson.loads(f.read())
 
         if not isinstance(leads, list):
             print(f"❌ Error: Input file must contain a JSON array of leads")
@@ -443,18 +594,34 @@ def main():
         print(f"❌ Error: Invalid JSON in input file: {e}")
         sys.exit(1)
 
+    # uvloop (libuv) cuts per-await overhead when installed
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
     # Find LinkedIn profiles (async)
-    enriched_leads = asyncio.run(find_linkedin_for_leads(
+    enriched_leads = run(find_linkedin_for_leads(
         leads,
         delay=args.delay,
         max_strategies=args.max_strategies,
-        max_concurrent=args.max_concurrent
+        max_concurrent=args.max_concurrent,
+        use_cache=not args.no_cache
     ))
 
     # Save results
     try:
-        with open(args.output, 'w') as f:
-            json.dump(enriched_leads, f, indent=2)
+        # Stream one lead at a time instead of building the whole document;
+        # compact unless --pretty
+        dump_option = orjson.OPT_INDENT_2 if args.pretty else None
+        with open(args.output, 'wb') as f:
+            f.write(b'[\n')
+            for i, lead in enumerate(enriched_leads):
+                if i:
+                    f.write(b',\n')
+                f.write(orjson.dumps(lead, option=dump_option))
+            f.write(b'\n]\n')
 
         print(f"💾 Saved {len(enriched_leads)} enriched leads to {args.output}")
         print(f"🎉 Done!")
@@ -18,10 +18,14 @@ Usage:
 """
 
 import time
+import bisect
+import asyncio
 import random
+import itertools
 import threading
-from collections import defaultdict
-from typing import Dict, Optional, List
+import weakref
+from collections import defaultdict, deque
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 
@@ -56,6 +60,24 @@ USER_AGENT_WEIGHTS = [
     1, 1,        # Edge
 ]
 
+# Cumulative weights, precomputed so each pick is one bisect (random.choices rebuilds them per call)
+_UA_CUM_WEIGHTS = list(itertools.accumulate(USER_AGENT_WEIGHTS))
+_UA_TOTAL_WEIGHT = _UA_CUM_WEIGHTS[-1]
+
+# Static browser headers sent with every request (User-Agent is added per call)
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+}
+
 # Default rate limits by target type
 RATE_LIMITS = {
     "serpapi": {
@@ -86,6 +108,22 @@ RATE_LIMITS = {
 }
 
 
+def _retire_delay_cell(limiter_ref: "weakref.ref", cell: List[float]):
+    """
+    Queue a finished thread's delay cell for folding into the base total.
+
+    Runs from GC on whatever thread triggered it, possibly one holding
+    _stats_lock, so it must not take the lock; deque.append is atomic.
+    """
+    limiter = limiter_ref()
+    if limiter is not None:
+        limiter._retired_cells.append(cell)
+
+
+# Number of lock stripes per limiter (power of two, domains hash onto one)
+LOCK_STRIPES = 64
+
+
 class RateLimiter:
     """
     Adaptive rate limiter for web scraping and API calls.
@@ -107,21 +145,60 @@ class RateLimiter:
         self.config = RATE_LIMITS.get(target_type, RATE_LIMITS["website"])
         self.target_type = target_type
 
+        # Token bucket per domain: refills to a full minute's budget at a steady rate
+        self.capacity = float(self.config.get("requests_per_domain_per_minute",
+                                              self.config.get("requests_per_minute", 30)))
+        self.refill_rate = self.capacity / 60.0  # tokens per second
+
         # Per-domain tracking
-        self.domain_requests: Dict[str, List[float]] = defaultdict(list)  # timestamps
+        self.domain_buckets: Dict[str, Tuple[float, float]] = {}  # (tokens, last_refill)
         self.domain_delays: Dict[str, float] = {}  # current delay per domain
         self.domain_failures: Dict[str, int] = defaultdict(int)  # consecutive failures
 
-        # Thread safety
-        self._lock = threading.Lock()
-
-        # Stats
+        # Thread safety: striped per-domain locks so unrelated domains don't serialize
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._stats_lock = threading.Lock()
+
+        # Stats (counters are bumped under _stats_lock; delay seconds
+        # accumulate in per-thread cells that get_stats merges; a thread's
+        # cell folds into _delay_total once the thread is gone)
+        self._tls = threading.local()
+        self._delay_cells: Dict[int, List[float]] = {}
+        self._delay_total = 0.0
+        self._retired_cells: deque = deque()
         self.stats = {
             "requests": 0,
             "rate_limited": 0,
             "delays_added": 0.0,
         }
 
+    def _count(self, key: str):
+        """Increment an integer stats counter."""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _add_delay(self, seconds: float):
+        """Accumulate sleep time into this thread's own cell (no shared write)."""
+        cell = getattr(self._tls, "delay", None)
+        if cell is None:
+            cell = self._tls.delay = [0.0]
+            with self._stats_lock:
+                self._fold_retired_cells()
+                self._delay_cells[id(cell)] = cell
+            weakref.finalize(threading.current_thread(), _retire_delay_cell, weakref.ref(self), cell)
+        cell[0] += seconds
+
+    def _fold_retired_cells(self):
+        """Move dead threads' cells into _delay_total (caller holds _stats_lock)."""
+        while self._retired_cells:
+            cell = self._retired_cells.popleft()
+            self._delay_total += cell[0]
+            del self._delay_cells[id(cell)]
+
+    def _lock_for(self, domain: str) -> threading.Lock:
+        """Get the lock stripe guarding a domain's state."""
+        return self._locks[hash(domain) & (LOCK_STRIPES - 1)]
+
     def _get_domain(self, url_or_domain: str) -> str:
         """Extract domain from URL or return as-is."""
         if "://" in url_or_domain:
@@ -129,12 +206,18 @@ class RateLimiter:
             return urlparse(url_or_domain).netloc
         return url_or_domain
 
-    def _clean_old_requests(self, domain: str, window_seconds: int = 60):
-        """Remove request timestamps older than window."""
-        cutoff = time.time() - window_seconds
-        self.domain_requests[domain] = [
-            ts for ts in self.domain_requests[domain] if ts > cutoff
-        ]
+    def _refill(self, domain: str, now: float) -> float:
+        """Return the domain's token count topped up for the time elapsed since last refill."""
+        bucket = self.domain_buckets.get(domain)
+        if bucket is None:
+            return self.capacity
+        tokens, last_refill = bucket
+        return min(self.capacity, tokens + (now - last_refill) * self.refill_rate)
+
+    def _take_token(self, domain: str):
+        """Spend one token for a request (may go negative for non-blocking callers)."""
+        now = time.monotonic()
+        self.domain_buckets[domain] = (self._refill(domain, now) - 1.0, now)
 
     def _get_current_delay(self, domain: str) -> float:
         """Get current delay for a domain."""
@@ -142,20 +225,12 @@ class RateLimiter:
 
     def _calculate_wait_time(self, domain: str) -> float:
         """Calculate how long to wait before next request."""
-        with self._lock:
-            self._clean_old_requests(domain)
-
-            # Check requests in last minute
-            recent_requests = len(self.domain_requests[domain])
-            max_per_minute = self.config.get("requests_per_domain_per_minute",
-                                              self.config.get("requests_per_minute", 30))
+        with self._lock_for(domain):
+            tokens = self._refill(domain, time.monotonic())
 
-            if recent_requests >= max_per_minute:
-                # Calculate wait time until oldest request expires
-                if self.domain_requests[domain]:
-                    oldest = min(self.domain_requests[domain])
-                    wait = (oldest + 60) - time.time()
-                    return max(0, wait)
+            if tokens < 1.0:
+                # Bucket empty - wait until the next token drips in
+                return (1.0 - tokens) / self.refill_rate
 
             # Return current delay for this domain
             return self._get_current_delay(domain)
@@ -177,17 +252,38 @@ class RateLimiter:
         wait_time = self._calculate_wait_time(domain)
         if wait_time > 0:
             time.sleep(wait_time)
-            with self._lock:
-                self.stats["delays_added"] += wait_time
+            self._add_delay(wait_time)
 
         # Record this request
-        with self._lock:
-            self.domain_requests[domain].append(time.time())
-            self.stats["requests"] += 1
+        with self._lock_for(domain):
+            self._take_token(domain)
+        self._count("requests")
 
         # Return headers with rotated User-Agent
         return self._get_headers()
 
+    async def aacquire(self, url_or_domain: str) -> Dict[str, str]:
+        """
+        Awaitable version of acquire() - waits with asyncio.sleep, not a thread.
+
+        The request is only recorded once the wait is over, so cancelling a
+        caller that is still waiting spends none of the domain's budget.
+        """
+        domain = self._get_domain(url_or_domain)
+
+        # Wait if needed
+        wait_time = self._calculate_wait_time(domain)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+            self._add_delay(wait_time)
+
+        # Record this request
+        with self._lock_for(domain):
+            self._take_token(domain)
+        self._count("requests")
+
+        return self._get_headers()
+
     def acquire_async(self, url_or_domain: str) -> Dict[str, str]:
         """
         Non-blocking version - returns headers immediately.
@@ -195,29 +291,19 @@ class RateLimiter:
         """
         domain = self._get_domain(url_or_domain)
 
-        with self._lock:
-            self.domain_requests[domain].append(time.time())
-            self.stats["requests"] += 1
+        with self._lock_for(domain):
+            self._take_token(domain)
+        self._count("requests")
 
         return self._get_headers()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with rotated User-Agent."""
-        ua = random.choices(USER_AGENTS, weights=USER_AGENT_WEIGHTS, k=1)[0]
+        ua = USER_AGENTS[bisect.bisect_right(_UA_CUM_WEIGHTS, random.random() * _UA_TOTAL_WEIGHT)]
 
-        return {
-            "User-Agent": ua,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-        }
+        headers = _BASE_HEADERS.copy()
+        headers["User-Agent"] = ua
+        return headers
 
     def report_response(self, url_or_domain: str, status_code: int):
         """
@@ -229,7 +315,8 @@ class RateLimiter:
         """
         domain = self._get_domain(url_or_domain)
 
-        with self._lock:
+        rate_limited = False
+        with self._lock_for(domain):
             current_delay = self._get_current_delay(domain)
 
             if status_code == 429 or status_code == 503:
@@ -237,7 +324,7 @@ class RateLimiter:
                 new_delay = min(current_delay * 2.5, self.config["max_delay"])
                 self.domain_delays[domain] = new_delay
                 self.domain_failures[domain] += 1
-                self.stats["rate_limited"] += 1
+                rate_limited = True
 
             elif status_code == 403:
                 # Forbidden - might be blocked, increase delay
@@ -256,6 +343,9 @@ class RateLimiter:
                 self.domain_delays[domain] = new_delay
                 self.domain_failures[domain] = 0  # Reset failures
 
+        if rate_limited:
+            self._count("rate_limited")
+
     def get_delay_for_domain(self, url_or_domain: str) -> float:
         """Get current delay for a specific domain."""
         domain = self._get_domain(url_or_domain)
@@ -264,26 +354,32 @@ class RateLimiter:
     def is_domain_blocked(self, url_or_domain: str, threshold: int = 5) -> bool:
         """Check if a domain appears to be blocking us."""
         domain = self._get_domain(url_or_domain)
-        with self._lock:
+        with self._lock_for(domain):
             return self.domain_failures.get(domain, 0) >= threshold
 
     def get_stats(self) -> Dict:
         """Get rate limiter statistics."""
-        with self._lock:
-            return {
-                **self.stats,
-                "domains_tracked": len(self.domain_requests),
-                "domains_with_elevated_delays": sum(
-                    1 for d, delay in self.domain_delays.items()
-                    if delay > self.config["base_delay"]
-                ),
-            }
+        # Snapshot per-domain state without taking every stripe; list() copies atomically
+        delays = list(self.domain_delays.values())
+        with self._stats_lock:
+            self._fold_retired_cells()
+            self.stats["delays_added"] = self._delay_total + sum(
+                cell[0] for cell in self._delay_cells.values()
+            )
+            stats = dict(self.stats)
+        return {
+            **stats,
+            "domains_tracked": len(self.domain_buckets),
+            "domains_with_elevated_delays": sum(
+                1 for delay in delays if delay > self.config["base_delay"]
+            ),
+        }
 
     def reset_domain(self, url_or_domain: str):
         """Reset tracking for a specific domain."""
         domain = self._get_domain(url_or_domain)
-        with self._lock:
-            self.domain_requests[domain] = []
+        with self._lock_for(domain):
+            self.domain_buckets.pop(domain, None)
             self.domain_delays.pop(domain, None)
             self.domain_failures[domain] = 0
 
@@ -18,7 +18,7 @@ import json
 import gzip
 from io import BytesIO
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from urllib.parse import urlparse, urljoin
 
 import httpx
@@ -51,11 +51,60 @@ class SitemapResult:
     errors: List[str] = field(default_factory=list)
 
 
+# =============================================================================
+# Shared HTTP Client
+# =============================================================================
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+
+def _new_client(timeout: float, headers: Dict[str, str]) -> httpx.AsyncClient:
+    """Create a keep-alive HTTP/2 client meant to be reused across many requests."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        http2=True,
+        limits=HTTP_LIMITS,
+        headers=headers,
+    )
+
+
+class _HTTPComponent:
+    """
+    Base for stages that fetch pages.
+
+    Uses the injected client when given so stages share one connection pool;
+    otherwise creates one on first request and closes it in aclose(). Stages
+    send their own HEADERS with each request, so a shared client keeps each
+    stage's User-Agent.
+    """
+
+    HEADERS = {"User-Agent": "LeadSnipe/1.0"}
+
+    def __init__(self, timeout: int, client: Optional[httpx.AsyncClient] = None):
+        self.timeout = timeout
+        self._client = client
+        self._owns_client = False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = _new_client(self.timeout, self.HEADERS)
+            self._owns_client = True
+        return self._client
+
+    async def aclose(self):
+        """Close the client if this stage created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._owns_client = False
+
+
 # =============================================================================
 # Sitemap Discovery (SITEMAP-01)
 # =============================================================================
 
-class SitemapDiscovery:
+class SitemapDiscovery(_HTTPComponent):
     """
     Discovers sitemap URLs for a domain.
 
@@ -76,8 +125,10 @@ class SitemapDiscovery:
         "/sitemap-index.xml",
     ]
 
-    def __init__(self, timeout: int = 10):
-        self.timeout = timeout
+    HEADERS = {"User-Agent": "LeadSnipe/1.0 (sitemap crawler)"}
+
+    def __init__(self, timeout: int = 10, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(timeout, client)
 
     async def discover(self, domain: str) -> List[str]:
         """
@@ -88,31 +139,28 @@ class SitemapDiscovery:
         sitemaps = []
         base_url = f"https://{domain}"
 
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            follow_redirects=True,
-            headers={"User-Agent": "LeadSnipe/1.0 (sitemap crawler)"}
-        ) as client:
-            # Method 1: Check robots.txt
-            robots_sitemaps = await self._from_robots(client, base_url)
-            sitemaps.extend(robots_sitemaps)
-
-            # Method 2: Try common paths if robots.txt didn't work
-            if not sitemaps:
-                common_sitemaps = await self._from_common_paths(client, base_url)
-                sitemaps.extend(common_sitemaps)
-
-            # Method 3: Check homepage for link tag
-            if not sitemaps:
-                link_sitemaps = await self._from_html_link(client, base_url)
-                sitemaps.extend(link_sitemaps)
+        client = self._get_client()
+
+        # Method 1: Check robots.txt
+        robots_sitemaps = await self._from_robots(client, base_url)
+        sitemaps.extend(robots_sitemaps)
+
+        # Method 2: Try common paths if robots.txt didn't work
+        if not sitemaps:
+            common_sitemaps = await self._from_common_paths(client, base_url)
+            sitemaps.extend(common_sitemaps)
+
+        # Method 3: Check homepage for link tag
+        if not sitemaps:
+            link_sitemaps = await self._from_html_link(client, base_url)
+            sitemaps.extend(link_sitemaps)
 
         return list(set(sitemaps))  # Dedupe
 
     async def _from_robots(self, client: httpx.AsyncClient, base_url: str) -> List[str]:
         """Extract Sitemap: directives from robots.txt."""
         try:
-            response = await client.get(f"{base_url}/robots.txt")
+            response = await client.get(f"{base_url}/robots.txt", headers=self.HEADERS)
             if response.status_code != 200:
                 return []
 
@@ -132,7 +180,7 @@ class SitemapDiscovery:
         for path in self.COMMON_PATHS:
             try:
                 url = f"{base_url}{path}"
-                response = await client.head(url)
+                response = await client.head(url, headers=self.HEADERS)
                 if response.status_code == 200:
                     content_type = response.headers.get("content-type", "")
                     if "xml" in content_type or path.endswith(".xml") or path.endswith(".gz"):
@@ -145,7 +193,7 @@ class SitemapDiscovery:
     async def _from_html_link(self, client: httpx.AsyncClient, base_url: str) -> List[str]:
         """Look for <link rel="sitemap"> in homepage."""
         try:
-            response = await client.get(base_url)
+            response = await client.get(base_url, headers=self.HEADERS)
             if response.status_code != 200:
                 return []
 
@@ -164,7 +212,7 @@ class SitemapDiscovery:
 # Sitemap Parser (SITEMAP-02)
 # =============================================================================
 
-class SitemapParser:
+class SitemapParser(_HTTPComponent):
     """
     Parses XML sitemaps recursively.
 
@@ -173,9 +221,19 @@ class SitemapParser:
     """
 
     SITEMAP_NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    SITEMAP_TAG = f"{{{SITEMAP_NS['sm']}}}sitemap"
+    URL_TAG = f"{{{SITEMAP_NS['sm']}}}url"
+    LOC_TAG = f"{{{SITEMAP_NS['sm']}}}loc"
 
-    def __init__(self, timeout: int = 15, max_depth: int = 3):
-        self.timeout = timeout
+    HEADERS = {"User-Agent": "LeadSnipe/1.0 (sitemap crawler)"}
+
+    def __init__(
+        self,
+        timeout: int = 15,
+        max_depth: int = 3,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        super().__init__(timeout, client)
         self.max_depth = max_depth
 
     async def parse(self, sitemap_url: str, depth: int = 0) -> List[str]:
@@ -190,53 +248,60 @@ class SitemapParser:
         urls = []
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": "LeadSnipe/1.0 (sitemap crawler)"}
-            ) as client:
-                response = await client.get(sitemap_url)
-                if response.status_code != 200:
-                    return []
-
-                content = response.content
-
-                # Handle gzip compressed sitemaps
-                if sitemap_url.endswith(".gz") or response.headers.get("content-encoding") == "gzip":
-                    try:
-                        content = gzip.decompress(content)
-                    except Exception:
-                        pass
-
-                # Parse XML
+            client = self._get_client()
+            response = await client.get(sitemap_url, headers=self.HEADERS)
+            if response.status_code != 200:
+                return []
+
+            content = response.content
+
+            # Handle gzip compressed sitemaps
+            if sitemap_url.endswith(".gz") or response.headers.get("content-encoding") == "gzip":
                 try:
-                    root = etree.fromstring(content)
-                except etree.XMLSyntaxError:
-                    # Try to clean up malformed XML
-                    try:
-                        parser = etree.XMLParser(recover=True)
-                        root = etree.fromstring(content, parser)
-                    except Exception:
-                        return []
-
-                # Check if this is a sitemap index
-                sitemap_refs = root.xpath("//sm:sitemap/sm:loc/text()", namespaces=self.SITEMAP_NS)
-
-                if sitemap_refs:
-                    # Recursively parse referenced sitemaps
-                    for ref in sitemap_refs:
-                        child_urls = await self.parse(ref.strip(), depth + 1)
-                        urls.extend(child_urls)
-                else:
-                    # Regular sitemap - extract URLs
-                    page_urls = root.xpath("//sm:url/sm:loc/text()", namespaces=self.SITEMAP_NS)
-                    urls.extend([u.strip() for u in page_urls])
+                    content = gzip.decompress(content)
+                except Exception:
+                    pass
+
+            # Stream-parse XML (recover=True tolerates malformed sitemaps)
+            sitemap_refs, page_urls = self._scan_locs(content)
+
+            if sitemap_refs:
+                # Recursively parse referenced sitemaps
+                for ref in sitemap_refs:
+                    child_urls = await self.parse(ref, depth + 1)
+                    urls.extend(child_urls)
+            else:
+                # Regular sitemap - extract URLs
+                urls.extend(page_urls)
 
         except Exception:
             pass
 
         return urls
 
+    def _scan_locs(self, content: bytes) -> Tuple[List[str], List[str]]:
+        """
+        Collect <loc> values without building the whole tree in memory.
+
+        Returns (sitemap_refs, page_urls).
+        """
+        sitemap_refs, page_urls = [], []
+        for _, elem in etree.iterparse(
+            BytesIO(content), events=("end",),
+            tag=(self.SITEMAP_TAG, self.URL_TAG), recover=True
+        ):
+            loc = elem.findtext(self.LOC_TAG)
+            if loc:
+                target = sitemap_refs if elem.tag == self.SITEMAP_TAG else page_urls
+                target.append(loc.strip())
+
+            # Drop the finished entry and its processed siblings to keep memory flat
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        return sitemap_refs, page_urls
+
 
 # =============================================================================
 # URL Classification (SITEMAP-03)
@@ -271,6 +336,10 @@ class URLClassifier:
         r"/company/?$",
     ]
 
+    # Each group folded into one alternation so a path is scanned once per category
+    CONTACT_RE = re.compile("|".join(f"(?:{p})" for p in CONTACT_PATTERNS))
+    TEAM_RE = re.compile("|".join(f"(?:{p})" for p in TEAM_PATTERNS))
+
     def classify(self, urls: List[str]) -> Dict[str, List[str]]:
         """
         Classify URLs into categories.
@@ -293,14 +362,12 @@ class URLClassifier:
             return "other"
 
         # Check contact patterns first (more specific)
-        for pattern in self.CONTACT_PATTERNS:
-            if re.search(pattern, path):
-                return "contact"
+        if self.CONTACT_RE.search(path):
+            return "contact"
 
         # Check team patterns
-        for pattern in self.TEAM_PATTERNS:
-            if re.search(pattern, path):
-                return "team"
+        if self.TEAM_RE.search(path):
+            return "team"
 
         return "other"
 
@@ -309,7 +376,7 @@ class URLClassifier:
 # Email Extraction (SITEMAP-04)
 # =============================================================================
 
-class EmailExtractor:
+class EmailExtractor(_HTTPComponent):
     """Extracts email addresses from web pages."""
 
     EMAIL_PATTERN = re.compile(
@@ -324,51 +391,54 @@ class EmailExtractor:
         r"@domain\.com$", r"@email\.com$", r"@company\.com$",
         r"wixpress\.com$", r"@2x\.", r"@3x\.",
     ]
+    BLACKLIST_RE = re.compile("|".join(BLACKLIST_PATTERNS), re.IGNORECASE)
 
-    def __init__(self, timeout: int = 10):
-        self.timeout = timeout
+    HEADERS = {"User-Agent": "LeadSnipe/1.0 (email extractor)"}
+
+    # Obfuscated spellings -> replacement, applied in order (spaced variants first)
+    OBFUSCATIONS = (
+        (" [at] ", "@"), ("[at]", "@"), ("(at)", "@"),
+        (" [dot] ", "."), ("[dot]", "."), ("(dot)", "."),
+        (" at ", "@"), (" dot ", "."),
+        ("&#64;", "@"), ("&#46;", "."),
+    )
+
+    def __init__(self, timeout: int = 10, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(timeout, client)
 
     async def extract(self, url: str) -> List[str]:
         """Extract email addresses from a URL."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": "LeadSnipe/1.0 (email extractor)"}
-            ) as client:
-                response = await client.get(url)
-                if response.status_code != 200:
-                    return []
+            client = self._get_client()
+            response = await client.get(url, headers=self.HEADERS)
+            if response.status_code != 200:
+                return []
 
-                html = response.text
+            html = response.text
 
-                # Decode common obfuscation
-                html = self._decode_obfuscation(html)
+            # Decode common obfuscation
+            html = self._decode_obfuscation(html)
 
-                # Extract from text
-                text_emails = self.EMAIL_PATTERN.findall(html)
+            # Extract from text
+            text_emails = self.EMAIL_PATTERN.findall(html)
 
-                # Extract from mailto: links
-                mailto_emails = self._extract_mailto(html)
+            # Extract from mailto: links
+            mailto_emails = self._extract_mailto(html)
 
-                # Combine and filter
-                all_emails = list(set(text_emails + mailto_emails))
-                filtered = self._filter_emails(all_emails)
+            # Combine and filter
+            all_emails = list(set(text_emails + mailto_emails))
+            filtered = self._filter_emails(all_emails)
 
-                return filtered
+            return filtered
 
         except Exception:
             return []
 
     def _decode_obfuscation(self, html: str) -> str:
         """Decode common email obfuscation patterns."""
-        replacements = [
-            (" [at] ", "@"), ("[at]", "@"), ("(at)", "@"),
-            (" [dot] ", "."), ("[dot]", "."), ("(dot)", "."),
-            (" at ", "@"), (" dot ", "."),
-            ("&#64;", "@"), ("&#46;", "."),
-        ]
-        for old, new in replacements:
+        # Sequential str.replace beats a single alternation regex here: each pass
+        # is a C-level substring scan and returns the input unchanged when absent
+        for old, new in self.OBFUSCATIONS:
             html = html.replace(old, new)
         return html
 
@@ -386,23 +456,17 @@ class EmailExtractor:
 
     def _filter_emails(self, emails: List[str]) -> List[str]:
         """Filter out false positives."""
-        filtered = []
-        for email in emails:
-            email_lower = email.lower()
-            is_blacklisted = any(
-                re.search(pattern, email_lower)
-                for pattern in self.BLACKLIST_PATTERNS
-            )
-            if not is_blacklisted and len(email) > 5:
-                filtered.append(email)
-        return filtered
+        return [
+            email for email in emails
+            if len(email) > 5 and not self.BLACKLIST_RE.search(email)
+        ]
 
 
 # =============================================================================
 # Staff Extraction (SITEMAP-05)
 # =============================================================================
 
-class StaffExtractor:
+class StaffExtractor(_HTTPComponent):
     """Extracts staff names and titles from team pages."""
 
     # CSS class patterns that often contain team members
@@ -411,36 +475,34 @@ class StaffExtractor:
         r"leadership", r"bio", r"profile", r"founder", r"executive"
     ]
 
-    def __init__(self, timeout: int = 10):
-        self.timeout = timeout
+    HEADERS = {"User-Agent": "LeadSnipe/1.0 (staff extractor)"}
+
+    def __init__(self, timeout: int = 10, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(timeout, client)
 
     async def extract(self, url: str) -> List[StaffMember]:
         """Extract staff members from a team page."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": "LeadSnipe/1.0 (staff extractor)"}
-            ) as client:
-                response = await client.get(url)
-                if response.status_code != 200:
-                    return []
+            client = self._get_client()
+            response = await client.get(url, headers=self.HEADERS)
+            if response.status_code != 200:
+                return []
 
-                html = response.text
+            html = response.text
 
-                # Try multiple extraction methods
-                staff = []
+            # Try multiple extraction methods
+            staff = []
 
-                # Method 1: Schema.org JSON-LD
-                jsonld_staff = self._extract_jsonld(html)
-                staff.extend(jsonld_staff)
+            # Method 1: Schema.org JSON-LD
+            jsonld_staff = self._extract_jsonld(html)
+            staff.extend(jsonld_staff)
 
-                # Method 2: HTML card patterns
-                if not staff:
-                    card_staff = self._extract_from_cards(html)
-                    staff.extend(card_staff)
+            # Method 2: HTML card patterns
+            if not staff:
+                card_staff = self._extract_from_cards(html)
+                staff.extend(card_staff)
 
-                return staff
+            return staff
 
         except Exception:
             return []
@@ -554,7 +616,7 @@ class StaffExtractor:
 # Main Sniper Class (Task 2.6)
 # =============================================================================
 
-class SitemapSniper:
+class SitemapSniper(_HTTPComponent):
     """
     Main class to snipe sitemaps for lead data.
 
@@ -565,13 +627,17 @@ class SitemapSniper:
         self,
         timeout: int = 10,
         max_sitemap_depth: int = 3,
-        request_delay: float = 0.5
+        request_delay: float = 0.5,
+        client: Optional[httpx.AsyncClient] = None
     ):
-        self.discovery = SitemapDiscovery(timeout=timeout)
-        self.parser = SitemapParser(timeout=timeout, max_depth=max_sitemap_depth)
+        # One keep-alive pool for every stage (created here unless injected)
+        super().__init__(timeout, client)
+        client = self._get_client()
+        self.discovery = SitemapDiscovery(timeout=timeout, client=client)
+        self.parser = SitemapParser(timeout=timeout, max_depth=max_sitemap_depth, client=client)
         self.classifier = URLClassifier()
-        self.email_extractor = EmailExtractor(timeout=timeout)
-        self.staff_extractor = StaffExtractor(timeout=timeout)
+        self.email_extractor = EmailExtractor(timeout=timeout, client=client)
+        self.staff_extractor = StaffExtractor(timeout=timeout, client=client)
         self.request_delay = request_delay
 
     async def snipe(self, domain: str) -> SitemapResult:
@@ -645,36 +711,33 @@ class SitemapSniper:
         contact_paths = ["/contact", "/contact-us", "/about/contact"]
         team_paths = ["/about", "/about-us", "/team", "/our-team"]
 
-        async with httpx.AsyncClient(
-            timeout=10,
-            follow_redirects=True,
-            headers={"User-Agent": "LeadSnipe/1.0"}
-        ) as client:
-            # Try contact pages
-            for path in contact_paths:
-                try:
-                    url = f"{base_url}{path}"
-                    response = await client.head(url)
-                    if response.status_code == 200:
-                        result.contact_pages.append(url)
-                        emails = await self.email_extractor.extract(url)
-                        result.emails.extend(emails)
-                        break
-                except Exception:
-                    pass
+        client = self._get_client()
 
-            # Try team pages
-            for path in team_paths:
-                try:
-                    url = f"{base_url}{path}"
-                    response = await client.head(url)
-                    if response.status_code == 200:
-                        result.team_pages.append(url)
-                        staff = await self.staff_extractor.extract(url)
-                        result.staff.extend(staff)
-                        break
-                except Exception:
-                    pass
+        # Try contact pages
+        for path in contact_paths:
+            try:
+                url = f"{base_url}{path}"
+                response = await client.head(url)
+                if response.status_code == 200:
+                    result.contact_pages.append(url)
+                    emails = await self.email_extractor.extract(url)
+                    result.emails.extend(emails)
+                    break
+            except Exception:
+                pass
+
+        # Try team pages
+        for path in team_paths:
+            try:
+                url = f"{base_url}{path}"
+                response = await client.head(url)
+                if response.status_code == 200:
+                    result.team_pages.append(url)
+                    staff = await self.staff_extractor.extract(url)
+                    result.staff.extend(staff)
+                    break
+            except Exception:
+                pass
 
         result.emails = list(set(result.emails))
         return result
@@ -695,7 +758,10 @@ async def snipe_sitemap(domain: str) -> SitemapResult:
         SitemapResult with discovered data
     """
     sniper = SitemapSniper()
-    return await sniper.snipe(domain)
+    try:
+        return await sniper.snipe(domain)
+    finally:
+        await sniper.aclose()
 
 
 def snipe_sitemap_sync(domain: str) -> SitemapResult:
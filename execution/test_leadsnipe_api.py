@@ -0,0 +1,90 @@
+"""
+Unit Tests for LeadSnipe API Bulk Email Jobs
+
+Tests cover the background bulk send flow:
+- POST /api/email/send-bulk queues a job
+- GET /api/email/bulk/{job_id} reports its status and results
+- Finished jobs are evicted once BULK_JOBS_SIZE is exceeded
+"""
+
+import time
+from unittest.mock import patch
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+import leadsnipe_api
+
+
+@pytest.fixture(autouse=True)
+def clear_bulk_jobs():
+    """Keep bulk jobs from leaking between tests."""
+    leadsnipe_api.bulk_jobs.clear()
+    yield
+    leadsnipe_api.bulk_jobs.clear()
+
+
+@pytest.fixture
+def client():
+    # No context manager: startup hooks (database, workers) are not needed here
+    return TestClient(leadsnipe_api.app)
+
+
+def _fake_send(emails, delay_seconds=3, max_workers=5):
+    return [
+        {"success": email["to"] != "bad@example.com", "to": email["to"]}
+        for email in emails
+    ]
+
+
+def _wait_for_job(client, job_id, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/api/email/bulk/{job_id}").json()
+        if job["completed_at"] is not None or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+class TestBulkSendJobs:
+    """Tests for the bulk send job endpoints."""
+
+    def test_post_then_get_job(self, client):
+        """A queued job can be polled until its results are in."""
+        emails = [
+            {"to": "good@example.com", "subject": "Hi", "body": "Hello"},
+            {"to": "bad@example.com", "subject": "Hi", "body": "Hello"},
+        ]
+
+        with patch('leadsnipe_api.send_bulk_emails', side_effect=_fake_send):
+            response = client.post("/api/email/send-bulk", json={"emails": emails})
+            assert response.status_code == 200
+            queued = response.json()
+            assert queued["status"] == "queued"
+            assert queued["total"] == 2
+
+            job = _wait_for_job(client, queued["job_id"])
+
+        assert job["status"] == "completed"
+        assert job["success_count"] == 1
+        assert job["failed_count"] == 1
+        assert [r["to"] for r in job["results"]] == ["good@example.com", "bad@example.com"]
+
+    def test_unknown_job_returns_404(self, client):
+        response = client.get("/api/email/bulk/bulk_doesnotexist")
+
+        assert response.status_code == 404
+
+    def test_finished_jobs_are_evicted(self):
+        """Only finished jobs are dropped, oldest first."""
+        def job(job_id, done):
+            return {"job_id": job_id, "completed_at": "2026-01-01T00:00:00" if done else None}
+
+        with patch('leadsnipe_api.BULK_JOBS_SIZE', 2):
+            leadsnipe_api.store_bulk_job(job("running", False))
+            leadsnipe_api.store_bulk_job(job("old", True))
+            leadsnipe_api.store_bulk_job(job("newer", True))
+            leadsnipe_api.store_bulk_job(job("newest", False))
+
+        assert list(leadsnipe_api.bulk_jobs) == ["running", "newest"]
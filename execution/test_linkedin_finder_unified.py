@@ -0,0 +1,111 @@
+"""
+Unit Tests for Unified LinkedIn Finder
+
+Tests cover:
+- Name extraction from scraped HTML/text (false positive filtering)
+- Search memoization and in-flight lookup sharing
+"""
+
+import asyncio
+import pytest
+
+from linkedin_finder_unified import LinkedInFinder
+
+
+@pytest.fixture
+def finder():
+    return LinkedInFinder(verbose=False)
+
+
+class TestScanHtml:
+    """Tests for single-pass LinkedIn URL and name extraction."""
+
+    def test_extracts_names_and_profile(self, finder):
+        text = 'Owned by Mary Jane Watson. https://www.linkedin.com/in/mary-watson'
+
+        url, names = finder._scan_html(text)
+
+        assert url == 'https://linkedin.com/in/mary-watson'
+        assert names == ['Mary Jane Watson']
+
+    @pytest.mark.parametrize('text', [
+        'New York Plumbing',
+        'Serving New Jersey Homes',
+        'Contact Us Today',
+        'Licensed Insured Plumbers',
+    ])
+    def test_false_positive_phrases_yield_no_name(self, finder, text):
+        """A run containing a blocked phrase is rejected whole, not trimmed."""
+        assert finder._scan_html(text) == (None, [])
+
+    def test_real_names_survive_next_to_false_positives(self, finder):
+        text = 'New York Plumbing. Call Today. Jane Doe, founder.'
+
+        assert finder._scan_html(text)[1] == ['Jane Doe']
+
+
+class TestCachedSearch:
+    """Tests for the per-finder search memoizer."""
+
+    FOUND = {"linkedin_url": "https://linkedin.com/in/jane-doe", "owner_name": "Jane Doe"}
+
+    @staticmethod
+    def _search(result, cacheable=True, delay=0.0):
+        calls = []
+
+        async def search(client, business_name, owner_name, location):
+            calls.append(business_name)
+            await asyncio.sleep(delay)
+            return dict(result), cacheable
+
+        return search, calls
+
+    @pytest.mark.asyncio
+    async def test_definitive_result_is_cached(self, finder):
+        search, calls = self._search(self.FOUND)
+
+        first = await finder._cached_search('ddg', search, None, 'Acme', None, 'Newark')
+        second = await finder._cached_search('ddg', search, None, ' ACME ', None, 'newark')
+
+        assert first == second == self.FOUND
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_not_cached(self, finder):
+        search, calls = self._search({"linkedin_url": None}, cacheable=False)
+
+        await finder._cached_search('ddg', search, None, 'Acme', None, 'Newark')
+        await finder._cached_search('ddg', search, None, 'Acme', None, 'Newark')
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, finder):
+        search, calls = self._search(self.FOUND, delay=0.01)
+
+        results = await asyncio.gather(*(
+            finder._cached_search('ddg', search, None, 'Acme', None, 'Newark')
+            for _ in range(3)
+        ))
+
+        assert results == [self.FOUND] * 3
+        assert len(calls) == 1
+        assert finder._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_owner_lets_waiters_retry(self, finder):
+        """A waiter on a cancelled lookup searches itself instead of getting a miss."""
+        search, calls = self._search(self.FOUND, delay=0.05)
+
+        owner = asyncio.create_task(
+            finder._cached_search('ddg', search, None, 'Acme', None, 'Newark'))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(
+            finder._cached_search('ddg', search, None, 'Acme', None, 'Newark'))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+
+        assert await waiter == self.FOUND
+        assert owner.cancelled()
+        assert len(calls) == 2
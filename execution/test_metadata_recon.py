@@ -8,9 +8,10 @@ Covers requirements META-01 and META-02.
 import asyncio
 import ssl
 import socket
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import pytest
 
+import metadata_recon
 from metadata_recon import (
     CertInfo,
     MetadataResult,
@@ -88,6 +89,14 @@ DV_CERT_ORG_AS_CN = {
 }
 
 
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+    """Keep cached results from leaking between tests."""
+    metadata_recon._metadata_cache.clear()
+    yield
+    metadata_recon._metadata_cache.clear()
+
+
 # =============================================================================
 # SSLCertExtractor Tests (META-01)
 # =============================================================================
@@ -95,6 +104,14 @@ DV_CERT_ORG_AS_CN = {
 class TestSSLCertExtractor:
     """Tests for SSL certificate extraction."""
 
+    @pytest.fixture(autouse=True)
+    def stub_resolver(self):
+        """Resolve every hostname to a fixed address without DNS."""
+        with patch('metadata_recon._resolve', return_value=['93.184.216.34']), \
+                patch('metadata_recon._resolve_async', new_callable=AsyncMock,
+                      return_value=['93.184.216.34']):
+            yield
+
     def test_parse_ov_cert(self):
         """Test parsing OV certificate extracts organization."""
         extractor = SSLCertExtractor()
@@ -138,7 +155,7 @@ class TestSSLCertExtractor:
         assert info.error is None
 
     @patch('socket.create_connection')
-    @patch('ssl.create_default_context')
+    @patch('metadata_recon._get_ssl_context')
     def test_extract_success(self, mock_ssl_context, mock_connection):
         """Test successful certificate extraction."""
         # Setup mocks
@@ -159,7 +176,7 @@ class TestSSLCertExtractor:
 
         assert info.organization == 'Example Corporation'
         assert info.error is None
-        mock_connection.assert_called_once_with(('example.com', 443), timeout=10)
+        mock_connection.assert_called_once_with(('93.184.216.34', 443), timeout=10)
 
     @patch('socket.create_connection')
     def test_extract_timeout(self, mock_connection):
@@ -195,7 +212,7 @@ class TestSSLCertExtractor:
         assert info.organization is None
 
     @patch('socket.create_connection')
-    @patch('ssl.create_default_context')
+    @patch('metadata_recon._get_ssl_context')
     def test_extract_ssl_error(self, mock_ssl_context, mock_connection):
         """Test handling of SSL errors."""
         mock_sock = MagicMock()
@@ -212,7 +229,7 @@ class TestSSLCertExtractor:
         assert 'ssl_error' in info.error
 
     @patch('socket.create_connection')
-    @patch('ssl.create_default_context')
+    @patch('metadata_recon._get_ssl_context')
     def test_extract_retries_without_verification(self, mock_ssl_context, mock_connection):
         """Test that SSL verification errors trigger retry without verification."""
         mock_sock = MagicMock()
@@ -247,15 +264,150 @@ class TestSSLCertExtractor:
 
     @pytest.mark.asyncio
     async def test_extract_async(self):
-        """Test async extraction wrapper."""
-        with patch.object(SSLCertExtractor, 'extract') as mock_extract:
-            mock_extract.return_value = CertInfo(organization='Test Corp')
+        """Test native async extraction via asyncio.open_connection."""
+        mock_writer = MagicMock()
+        mock_writer.get_extra_info.return_value = OV_CERT
+        mock_writer.wait_closed = AsyncMock()
+
+        with patch('asyncio.open_connection', new_callable=AsyncMock) as mock_open:
+            mock_open.return_value = (MagicMock(), mock_writer)
 
             extractor = SSLCertExtractor()
             info = await extractor.extract_async('example.com')
 
-            assert info.organization == 'Test Corp'
-            mock_extract.assert_called_once_with('example.com', 443)
+        assert info.organization == 'Example Corporation'
+        assert info.error is None
+        mock_writer.get_extra_info.assert_called_once_with('peercert')
+        mock_writer.close.assert_called_once()
+        args, kwargs = mock_open.call_args
+        assert args[:2] == ('93.184.216.34', 443)
+        assert kwargs['server_hostname'] == 'example.com'
+
+    @pytest.mark.asyncio
+    async def test_extract_async_timeout(self):
+        """Test async extraction maps handshake timeouts."""
+        with patch('asyncio.open_connection', new_callable=AsyncMock) as mock_open:
+            mock_open.side_effect = asyncio.TimeoutError()
+
+            extractor = SSLCertExtractor()
+            info = await extractor.extract_async('slow.example.com')
+
+        assert info.error == 'timeout'
+        assert info.organization is None
+
+
+def _make_der_cert(subject_attrs, issuer_attrs) -> bytes:
+    """Build a self-signed DER certificate with the given name attributes."""
+    x509 = pytest.importorskip('cryptography.x509')
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from datetime import datetime, timedelta, timezone
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    now = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(x509.Name([x509.NameAttribute(oid, value) for oid, value in subject_attrs]))
+        .issuer_name(x509.Name([x509.NameAttribute(oid, value) for oid, value in issuer_attrs]))
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return cert.public_bytes(serialization.Encoding.DER)
+
+
+class TestDecodeDerCert:
+    """Tests for decoding unverified (DER) certificates."""
+
+    def test_decode_real_der_cert(self):
+        """A DER cert decodes to the same shape as getpeercert()."""
+        oid = pytest.importorskip('cryptography.x509.oid')
+        der = _make_der_cert(
+            [
+                (oid.NameOID.COUNTRY_NAME, 'US'),
+                (oid.NameOID.ORGANIZATION_NAME, 'Example Corporation'),
+                (oid.NameOID.COMMON_NAME, 'www.example.com'),
+            ],
+            [
+                (oid.NameOID.ORGANIZATION_NAME, 'DigiCert Inc'),
+                (oid.NameOID.COMMON_NAME, 'DigiCert SHA2 Extended Validation Server CA'),
+            ],
+        )
+
+        cert = metadata_recon._decode_der_cert(der)
+
+        assert cert['subject'] == (
+            (('countryName', 'US'),),
+            (('organizationName', 'Example Corporation'),),
+            (('commonName', 'www.example.com'),),
+        )
+        info = SSLCertExtractor()._parse_cert(cert)
+        assert info.organization == 'Example Corporation'
+        assert info.issuer_org == 'DigiCert Inc'
+
+    def test_decode_garbage_returns_empty(self):
+        pytest.importorskip('cryptography')
+        assert metadata_recon._decode_der_cert(b'not a certificate') == {}
+
+    def test_decode_without_cryptography_returns_empty(self):
+        with patch('metadata_recon.HAS_CRYPTOGRAPHY', False):
+            assert metadata_recon._decode_der_cert(b'\x30\x82') == {}
+
+    def test_decode_none_returns_empty(self):
+        assert metadata_recon._decode_der_cert(None) == {}
+
+
+class TestResolve:
+    """Tests for the cached DNS resolver."""
+
+    @pytest.fixture(autouse=True)
+    def clear_dns_cache(self):
+        metadata_recon._dns_cache.clear()
+        yield
+        metadata_recon._dns_cache.clear()
+
+    @patch('socket.getaddrinfo')
+    def test_resolve_caches_addresses(self, mock_getaddrinfo):
+        """Test repeat lookups skip the resolver and dedupe addresses."""
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('93.184.216.34', 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('93.184.216.34', 0)),
+        ]
+
+        assert metadata_recon._resolve('example.com') == ['93.184.216.34']
+        assert metadata_recon._resolve('example.com') == ['93.184.216.34']
+        mock_getaddrinfo.assert_called_once()
+
+    @patch('socket.getaddrinfo')
+    def test_resolve_expires(self, mock_getaddrinfo):
+        """Test entries are refreshed after DNS_CACHE_TTL."""
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('93.184.216.34', 0)),
+        ]
+
+        metadata_recon._resolve('example.com')
+        expires_at, addresses = metadata_recon._dns_cache['example.com']
+        metadata_recon._dns_cache['example.com'] = (expires_at - 1000, addresses)
+        metadata_recon._resolve('example.com')
+
+        assert mock_getaddrinfo.call_count == 2
+
+    @patch('socket.getaddrinfo')
+    def test_resolve_evicts_least_recently_used(self, mock_getaddrinfo):
+        """Test the cache holds at most DNS_CACHE_SIZE hostnames."""
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('93.184.216.34', 0)),
+        ]
+
+        with patch('metadata_recon.DNS_CACHE_SIZE', 2):
+            metadata_recon._resolve('a.example.com')
+            metadata_recon._resolve('b.example.com')
+            metadata_recon._resolve('a.example.com')  # refresh a
+            metadata_recon._resolve('c.example.com')
+
+        assert list(metadata_recon._dns_cache) == ['a.example.com', 'c.example.com']
 
 
 # =============================================================================
@@ -393,6 +545,15 @@ class TestCleanOrgName:
         assert clean_org_name('Example, Co.') == 'Example'
         assert clean_org_name('Example Co') == 'Example'
 
+    def test_remove_stacked_suffixes(self):
+        """Test consecutive suffixes are all removed."""
+        assert clean_org_name('Example, Inc., LLC') == 'Example'
+        assert clean_org_name('Example Co. Ltd') == 'Example'
+
+    def test_preserve_suffix_inside_word(self):
+        """Test suffix letters without a separator are preserved."""
+        assert clean_org_name('Costco') == 'Costco'
+
     def test_preserve_middle_suffix(self):
         """Test suffix in middle is preserved."""
         assert clean_org_name('Inc. Technologies') == 'Inc. Technologies'
@@ -491,6 +652,32 @@ class TestGetMetadata:
 
             assert result.organization == 'Example Corporation'
 
+    @pytest.mark.asyncio
+    async def test_get_metadata_caches_by_hostname(self):
+        """Test repeat lookups reuse the cached result."""
+        with patch.object(SSLCertExtractor, 'extract_async') as mock_extract:
+            mock_extract.return_value = CertInfo(
+                organization='Example Corporation',
+                issuer_org='DigiCert Inc'
+            )
+
+            first = await get_metadata('example.com')
+            second = await get_metadata('https://EXAMPLE.com/about')
+
+            assert second is first
+            mock_extract.assert_called_once_with('example.com')
+
+    @pytest.mark.asyncio
+    async def test_get_metadata_does_not_cache_errors(self):
+        """Test failed lookups are retried on the next call."""
+        with patch.object(SSLCertExtractor, 'extract_async') as mock_extract:
+            mock_extract.return_value = CertInfo(error='timeout')
+
+            await get_metadata('slow.example.com')
+            await get_metadata('slow.example.com')
+
+            assert mock_extract.call_count == 2
+
     def test_get_metadata_sync(self):
         """Test synchronous wrapper."""
         with patch.object(SSLCertExtractor, 'extract_async') as mock_extract:
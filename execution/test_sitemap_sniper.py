@@ -195,7 +195,7 @@ class TestSitemapParser:
 
             call_count = 0
 
-            async def mock_get(url):
+            async def mock_get(url, **kwargs):
                 nonlocal call_count
                 call_count += 1
                 response = MagicMock()
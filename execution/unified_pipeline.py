@@ -288,7 +288,7 @@ class UnifiedPipeline:
     # Stage 3: LinkedIn Discovery (FREE)
     # =========================================================================
 
-    def stage3_find_linkedin(self, leads: List[Lead]) -> List[Lead]:
+    async def stage3_find_linkedin(self, leads: List[Lead]) -> List[Lead]:
         """
         Find LinkedIn profiles using FREE multi-strategy approach.
         """
@@ -315,7 +315,10 @@ class UnifiedPipeline:
 
         # Run LinkedIn finder
         finder = LinkedInFinder(workers=self.config.linkedin_workers, verbose=True)
-        enriched_dicts = finder.find_batch(lead_dicts, progress_callback=progress_cb)
+        try:
+            enriched_dicts = await finder.find_batch_async(lead_dicts, progress_callback=progress_cb)
+        finally:
+            await finder.aclose()
 
         # Update Lead objects with LinkedIn data
         linkedin_count = 0
@@ -521,7 +524,7 @@ class UnifiedPipeline:
             leads = self.stage2_verify_emails(leads)
 
             # Stage 3: LinkedIn Discovery (ALWAYS)
-            leads = self.stage3_find_linkedin(leads)
+            leads = await self.stage3_find_linkedin(leads)
 
             # Stage 4: Paid Fallback (OPTIONAL)
             if self.config.enable_paid_fallback: